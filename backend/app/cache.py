@@ -0,0 +1,48 @@
+"""In-process async memoization shared by the API modules."""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+
+
+def async_ttl_cache(ttl_seconds: float, *, maxsize: int = 128):
+    """Memoize an async function's result for ttl_seconds.
+
+    The cache holds the in-flight task rather than its result, so concurrent
+    callers with the same arguments share one computation; failures are not
+    cached. Every argument is part of the key, so the function must not take
+    anything request-scoped such as a DB session: the shared task would run on
+    the first caller's session. The wrapper exposes ``cache_clear()``.
+    """
+    def decorator(fn):
+        # key -> (expiry, task), least recently used first
+        cache: OrderedDict[tuple, tuple[float, asyncio.Future]] = OrderedDict()
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and hit[0] > now:
+                cache.move_to_end(key)
+                return await asyncio.shield(hit[1])
+
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            cache[key] = (now + ttl_seconds, task)
+            cache.move_to_end(key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+
+            def evict_failure(t: asyncio.Future) -> None:
+                # Don't serve a failure for the rest of the TTL. Runs when the
+                # task settles, even if every caller awaiting it was cancelled.
+                if (t.cancelled() or t.exception() is not None) and cache.get(key, (0, None))[1] is t:
+                    del cache[key]
+
+            task.add_done_callback(evict_failure)
+            return await asyncio.shield(task)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
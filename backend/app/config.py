@@ -10,6 +10,11 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = "changeme"
+    neo4j_pool_size: int = 50
+    neo4j_acquisition_timeout: float = 30.0
+    neo4j_max_connection_lifetime: float = 3600.0
+    neo4j_connection_timeout: float = 15.0
+    neo4j_warm_connections: int = 10
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
@@ -1,5 +1,7 @@
 """Neo4j async driver singleton and health check."""
 
+import asyncio
+
 from neo4j import AsyncGraphDatabase
 
 from ..config import get_settings
@@ -13,7 +15,15 @@ def get_driver():
     if _driver is None:
         s = get_settings()
         _driver = AsyncGraphDatabase.driver(
-            s.neo4j_uri, auth=(s.neo4j_user, s.neo4j_password)
+            s.neo4j_uri,
+            auth=(s.neo4j_user, s.neo4j_password),
+            # get_graph_insights opens one session per _INSIGHTS query at once;
+            # size the pool above that count, with headroom for other requests
+            max_connection_pool_size=s.neo4j_pool_size,
+            connection_acquisition_timeout=s.neo4j_acquisition_timeout,
+            max_connection_lifetime=s.neo4j_max_connection_lifetime,
+            connection_timeout=s.neo4j_connection_timeout,
+            keep_alive=True,
         )
     return _driver
 
@@ -26,6 +36,17 @@ async def close_driver():
         _driver = None
 
 
+async def _ping() -> None:
+    async with get_driver().session() as session:
+        result = await session.run("RETURN 1")
+        await result.consume()
+
+
+async def warm_pool() -> None:
+    """Open connections up front so the first requests don't pay the handshake."""
+    await asyncio.gather(*(_ping() for _ in range(get_settings().neo4j_warm_connections)))
+
+
 async def check_health() -> bool:
     """Return True if Neo4j is reachable."""
     driver = get_driver()
@@ -1,16 +1,56 @@
 """FastAPI router for the Neo4j knowledge graph API."""
 
-from fastapi import APIRouter, HTTPException
+import hashlib
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from .connection import check_health
-from .queries import get_full_graph, get_department_subgraph, get_project_lineage, get_graph_stats, get_graph_insights
+from .queries import (
+    get_full_graph,
+    get_department_subgraph,
+    get_project_lineage,
+    get_graph_stats,
+    get_graph_insights,
+    graph_version,
+)
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# route -> (graph version, serialized body, etag)
+_snapshots: dict[str, tuple[int, bytes, str]] = {}
+
+
+async def _snapshot_response(request: Request, key: str, load) -> Response:
+    """Serve a graph snapshot as cached bytes with an ETag, or 304 if unchanged.
+
+    The body is serialized once per graph version, so repeat hits skip both
+    Neo4j and JSON encoding until the next sync.
+    """
+    version = graph_version()
+    hit = _snapshots.get(key)
+    if hit is None or hit[0] != version:
+        body = orjson.dumps(await load())
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        hit = _snapshots[key] = (version, body, etag)
 
-router = APIRouter()
+    _, body, etag = hit
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/health")
-async def graph_health():
-    """Neo4j connectivity check."""
+async def graph_health(request: Request):
+    """Neo4j connectivity check; "warming" until the startup sync has built the graph."""
+    state = request.app.state
+    # Apps started without the lifespan never sync, so there is nothing to wait for
+    if not getattr(state, "graph_ready", True):
+        task = getattr(state, "graph_sync_task", None)
+        if task is None or not task.done():
+            return {"status": "warming"}
+        raise HTTPException(status_code=503, detail="Startup graph sync failed; see server logs")
     try:
         ok = await check_health()
         if ok:
@@ -21,10 +61,10 @@ async def graph_health():
 
 
 @router.get("/full")
-async def full_graph():
+async def full_graph(request: Request):
     """Full graph: all nodes and links for visualization."""
     try:
-        return await get_full_graph()
+        return await _snapshot_response(request, "full", get_full_graph)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -57,9 +97,9 @@ async def graph_insights():
 
 
 @router.get("/stats")
-async def graph_stats():
+async def graph_stats(request: Request):
     """Summary counts of nodes and relationships by type."""
     try:
-        return await get_graph_stats()
+        return await _snapshot_response(request, "stats", get_graph_stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
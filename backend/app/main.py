@@ -1,10 +1,23 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .database import init_db
 
 
+async def _initial_graph_sync(app: FastAPI) -> None:
+    """Build the knowledge graph in the background (non-fatal if Neo4j is unavailable)."""
+    from .graph.connection import warm_pool
+    from .graph.sync import full_sync
+    try:
+        await warm_pool()
+        await full_sync()
+        app.state.graph_ready = True
+    except Exception as e:
+        logging.warning(f"Neo4j graph sync failed (non-fatal): {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
@@ -14,18 +27,24 @@ async def lifespan(app: FastAPI):
     from .poc3_aims.seed import seed_if_empty as seed_aims
     await seed_aims()
 
-    # Sync knowledge graph (non-fatal if Neo4j is unavailable)
-    from .graph.sync import full_sync
-    try:
-        await full_sync()
-    except Exception as e:
-        logging.warning(f"Neo4j graph sync failed (non-fatal): {e}")
+    # Batched writer for /chat request records
+    from .poc1_governance.cost_tracker import run_cost_writer, stop_cost_writer
+    cost_writer = asyncio.create_task(run_cost_writer())
+
+    # Sync knowledge graph without blocking startup; /api/graph/health reports
+    # "warming" until it finishes
+    app.state.graph_ready = False
+    app.state.graph_sync_task = asyncio.create_task(_initial_graph_sync(app))
 
     yield
 
-    # Shutdown: close Neo4j driver
+    # Shutdown: stop an unfinished sync, close Neo4j driver, flush pending records
+    app.state.graph_sync_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.graph_sync_task
     from .graph.connection import close_driver
     await close_driver()
+    await stop_cost_writer(cost_writer)
 
 
 app = FastAPI(title="Gong AI Operating Model POC", version="1.0.0", lifespan=lifespan)
@@ -51,4 +70,10 @@ app.include_router(graph_router, prefix="/api/graph", tags=["graph"])
 
 @app.get("/api/health")
 async def health():
-    return {"status": "ok"}
+    from .poc1_governance.cost_tracker import cost_writer_stats
+    # Lost request records degrade the report but keep the check passing
+    cost_writer = cost_writer_stats()
+    return {
+        "status": "degraded" if cost_writer["dropped_records"] else "ok",
+        "cost_writer": cost_writer,
+    }
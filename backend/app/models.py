@@ -1,11 +1,34 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, JSON
+import functools
+import logging
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, JSON, Index, UniqueConstraint, event
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from .database import Base
 
+logger = logging.getLogger(__name__)
+
 
 class AIRequest(Base):
     """Tracks every LLM API call for governance/audit."""
     __tablename__ = "ai_requests"
+    __table_args__ = (
+        # Audit/SLA filters: equality on department or model plus a timestamp range
+        Index("ix_ai_requests_department_timestamp", "department", "timestamp"),
+        Index("ix_ai_requests_model_timestamp", "model", "timestamp"),
+        # Covers the SLA queries (time window, status, latency, model and
+        # department breakdowns) so they never read the table rows
+        Index("ix_ai_requests_sla", "timestamp", "status", "latency_ms", "model", "department"),
+        # Append-mostly time ranges: on Postgres a BRIN index summarizes them in a
+        # few pages. SQLite has no BRIN, so it is created only on PostgreSQL.
+        Index(
+            "ix_ai_requests_timestamp_brin", "timestamp",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     timestamp = Column(DateTime, server_default=func.now(), index=True)
@@ -24,6 +47,77 @@ class AIRequest(Base):
     error_message = Column(Text, nullable=True)
 
 
+class AIRequestDaily(Base):
+    """Per-day rollup of ai_requests, maintained on insert, for cost and forecast aggregates."""
+    __tablename__ = "ai_requests_daily"
+    __table_args__ = (UniqueConstraint("date", "department", "model", "provider"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    date = Column(Date, index=True)
+    department = Column(String(100))
+    model = Column(String(100))
+    provider = Column(String(50))
+    total_cost = Column(Float, default=0.0)
+    total_tokens = Column(Integer, default=0)
+    request_count = Column(Integer, default=0)
+    sum_latency = Column(Float, default=0.0)
+    error_count = Column(Integer, default=0)
+
+
+# Additive columns of AIRequestDaily, merged by summing on upsert
+ROLLUP_SUMS = ("total_cost", "total_tokens", "request_count", "sum_latency", "error_count")
+
+# INSERT ... ON CONFLICT constructs for the backends the rollup upsert supports
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+@functools.cache
+def _warn_rollup_unsupported(dialect: str) -> None:
+    """Log once per dialect that the incremental rollup is skipped there."""
+    logger.warning(
+        f"ai_requests_daily is not maintained on insert for {dialect!r}; "
+        "run rebuild_daily_rollup() to refresh it"
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _roll_up_new_requests(session, flush_context):
+    """Fold AIRequest rows inserted by this flush into ai_requests_daily, in the same transaction."""
+    buckets: dict[tuple, dict] = {}
+    for obj in session.new:
+        if not isinstance(obj, AIRequest):
+            continue
+        key = ((obj.timestamp or datetime.utcnow()).date(), obj.department, obj.model, obj.provider)
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = {
+                "date": key[0], "department": key[1], "model": key[2], "provider": key[3],
+                "total_cost": 0.0, "total_tokens": 0, "request_count": 0,
+                "sum_latency": 0.0, "error_count": 0,
+            }
+        bucket["total_cost"] += obj.cost_usd or 0.0
+        bucket["total_tokens"] += obj.total_tokens or 0
+        bucket["request_count"] += 1
+        bucket["sum_latency"] += obj.latency_ms or 0.0
+        bucket["error_count"] += obj.status != "success"
+
+    if not buckets:
+        return
+
+    connection = session.connection()
+    upsert_insert = _UPSERT_INSERTS.get(connection.dialect.name)
+    if upsert_insert is None:
+        # Never fail the flush (and so the AIRequest insert) over the rollup
+        _warn_rollup_unsupported(connection.dialect.name)
+        return
+    stmt = upsert_insert(AIRequestDaily)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["date", "department", "model", "provider"],
+        set_={c: getattr(AIRequestDaily, c) + getattr(stmt.excluded, c) for c in ROLLUP_SUMS},
+    )
+    connection.execute(stmt, list(buckets.values()))
+
+
 class AIProject(Base):
     """Tracks an AI automation project through the AIMS lifecycle."""
     __tablename__ = "ai_projects"
@@ -1,14 +1,63 @@
 """ISO 42001-aligned AI request audit logging and retrieval."""
 
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from sqlalchemy import select, func, and_, desc
+import orjson
+from sqlalchemy import select, func, and_, desc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..database import async_session
 from ..models import AIRequest
 
 
+def _encode_cursor(timestamp: datetime, request_id: int) -> str:
+    return f"{timestamp.isoformat()},{request_id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Parse a cursor from a previous page; raises ValueError if malformed."""
+    ts, _, request_id = cursor.rpartition(",")
+    return datetime.fromisoformat(ts), int(request_id)
+
+
+# Columns serialized into each audit entry
+_ENTRY_COLUMNS = (
+    AIRequest.id,
+    AIRequest.timestamp,
+    AIRequest.user_id,
+    AIRequest.department,
+    AIRequest.model,
+    AIRequest.provider,
+    AIRequest.task_tier,
+    AIRequest.prompt_hash,
+    AIRequest.input_tokens,
+    AIRequest.output_tokens,
+    AIRequest.total_tokens,
+    AIRequest.cost_usd,
+    AIRequest.latency_ms,
+    AIRequest.status,
+    AIRequest.error_message,
+)
+
+
+def _audit_filters(
+    days: int,
+    department: Optional[str],
+    model: Optional[str],
+    status: Optional[str],
+) -> list:
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    filters = [AIRequest.timestamp >= cutoff]
+    if department:
+        filters.append(AIRequest.department == department)
+    if model:
+        filters.append(AIRequest.model == model)
+    if status:
+        filters.append(AIRequest.status == status)
+    return filters
+
+
 async def get_audit_log(
     db: AsyncSession,
     *,
@@ -18,6 +67,7 @@ async def get_audit_log(
     status: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> dict:
     """Retrieve audit log entries with ISO 42001-aligned fields.
 
@@ -27,36 +77,50 @@ async def get_audit_log(
     - Performance monitoring (latency, status)
     - Data protection (prompt hash, not content)
     - Accountability (user/department tracking)
-    """
-    cutoff = datetime.utcnow() - timedelta(days=days)
-    filters = [AIRequest.timestamp >= cutoff]
-    if department:
-        filters.append(AIRequest.department == department)
-    if model:
-        filters.append(AIRequest.model == model)
-    if status:
-        filters.append(AIRequest.status == status)
 
-    # Total count
-    count_stmt = select(func.count(AIRequest.id)).where(and_(*filters))
-    total = (await db.execute(count_stmt)).scalar() or 0
+    Pass the previous page's ``next_cursor`` as ``cursor`` for keyset
+    pagination, which stays O(limit) at any depth; ``offset`` is only
+    applied when no cursor is given. Cursor pages return ``total_records``
+    and ``summary`` as None, since they were on the first page.
+    """
+    filters = _audit_filters(days, department, model, status)
 
-    # Paginated records
-    stmt = (
-        select(AIRequest)
-        .where(and_(*filters))
-        .order_by(desc(AIRequest.timestamp))
-        .limit(limit)
-        .offset(offset)
-    )
+    if cursor:
+        # Continuation page: the caller already has the totals from the first
+        # page, so skip them and read only limit + 1 rows off the index
+        stmt = (
+            select(*_ENTRY_COLUMNS)
+            .where(and_(*filters), tuple_(AIRequest.timestamp, AIRequest.id) < _decode_cursor(cursor))
+            .order_by(desc(AIRequest.timestamp), desc(AIRequest.id))
+            .limit(limit + 1)
+        )
+    else:
+        # First/offset page: totals over the whole filtered set ride along as
+        # window columns, computed in the same scan as the page
+        stmt = (
+            select(
+                *_ENTRY_COLUMNS,
+                func.count().over().label("total_requests"),
+                func.sum(AIRequest.cost_usd).over().label("total_cost"),
+                func.sum(AIRequest.total_tokens).over().label("total_tokens_sum"),
+                func.avg(AIRequest.latency_ms).over().label("avg_latency"),
+            )
+            .where(and_(*filters))
+            .order_by(desc(AIRequest.timestamp), desc(AIRequest.id))
+            .limit(limit + 1)
+            .offset(offset)
+        )
     result = await db.execute(stmt)
-    records = result.scalars().all()
+    records = result.all()
+    # The extra row only signals that another page exists
+    has_more = len(records) > limit
+    records = records[:limit]
 
     entries = [
         {
             "id": r.id,
             # ISO 42001 traceability
-            "timestamp": r.timestamp.isoformat() if r.timestamp else None,
+            "timestamp": r.timestamp,  # orjson renders datetimes as ISO 8601
             "user_id": r.user_id,
             "department": r.department,
             # AI system identification
@@ -79,28 +143,39 @@ async def get_audit_log(
     ]
 
     # Summary statistics for the filtered set
-    summary_stmt = (
-        select(
-            func.count(AIRequest.id).label("total_requests"),
-            func.sum(AIRequest.cost_usd).label("total_cost"),
-            func.sum(AIRequest.total_tokens).label("total_tokens"),
-            func.avg(AIRequest.latency_ms).label("avg_latency"),
-        )
-        .where(and_(*filters))
-    )
-    summary_row = (await db.execute(summary_stmt)).one()
+    summary = None
+    total = None
+    if not cursor:
+        if records:
+            summary_row = records[0]
+        else:
+            # Empty page (no matches, or offset past the end): totals need their own query
+            summary_stmt = (
+                select(
+                    func.count(AIRequest.id).label("total_requests"),
+                    func.sum(AIRequest.cost_usd).label("total_cost"),
+                    func.sum(AIRequest.total_tokens).label("total_tokens_sum"),
+                    func.avg(AIRequest.latency_ms).label("avg_latency"),
+                )
+                .where(and_(*filters))
+            )
+            summary_row = (await db.execute(summary_stmt)).one()
+        total = summary_row.total_requests or 0
+        summary = {
+            "total_requests": total,
+            "total_cost_usd": round(float(summary_row.total_cost or 0), 4),
+            "total_tokens": int(summary_row.total_tokens_sum or 0),
+            "avg_latency_ms": round(float(summary_row.avg_latency or 0), 1),
+        }
 
     return {
         "period_days": days,
         "total_records": total,
         "limit": limit,
         "offset": offset,
-        "summary": {
-            "total_requests": summary_row.total_requests or 0,
-            "total_cost_usd": round(float(summary_row.total_cost or 0), 4),
-            "total_tokens": int(summary_row.total_tokens or 0),
-            "avg_latency_ms": round(float(summary_row.avg_latency or 0), 1),
-        },
+        "has_more": has_more,
+        "next_cursor": _encode_cursor(records[-1].timestamp, records[-1].id) if has_more else None,
+        "summary": summary,
         "entries": entries,
         "iso_42001_compliance": {
             "traceability": True,
@@ -110,3 +185,28 @@ async def get_audit_log(
             "performance_monitoring": "latency_and_status_tracked",
         },
     }
+
+
+async def stream_audit_export(
+    *,
+    days: int = 30,
+    department: Optional[str] = None,
+    model: Optional[str] = None,
+    status: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """Yield every matching audit entry as an NDJSON line, newest first.
+
+    Rows come off a server-side cursor in batches, so memory stays flat
+    however large the export. Opens its own session: the response body is
+    sent after request-scoped dependencies may already have closed theirs.
+    """
+    stmt = (
+        select(*_ENTRY_COLUMNS)
+        .where(and_(*_audit_filters(days, department, model, status)))
+        .order_by(desc(AIRequest.timestamp), desc(AIRequest.id))
+        .execution_options(yield_per=500)
+    )
+    async with async_session() as db:
+        rows = await db.stream(stmt)
+        async for row in rows:
+            yield orjson.dumps(row._asdict()) + b"\n"
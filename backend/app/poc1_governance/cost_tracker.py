@@ -1,16 +1,36 @@
 """Token cost tracking, aggregation, and department chargeback allocation."""
 
+import asyncio
+import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import String, select, func, and_, case, delete, insert, type_coerce
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import AIRequest
+from ..cache import async_ttl_cache
+from ..database import async_session
+from ..models import AIRequest, AIRequestDaily
+
+logger = logging.getLogger(__name__)
+
+
+# Request records waiting to be written; None tells the writer to stop
+_pending: asyncio.Queue[Optional[dict]] = asyncio.Queue()
+
+WRITE_BATCH_SIZE = 500
+WRITE_INTERVAL_S = 0.1
+# A failed batch is retried with exponential backoff before it is dropped
+WRITE_ATTEMPTS = 3
+WRITE_RETRY_BACKOFF_S = 0.5
+
+# Set while run_cost_writer is draining _pending
+_writer_running = False
+# Records given up on after WRITE_ATTEMPTS failed writes (reported by /api/health)
+_dropped_records = 0
 
 
 async def record_cost(
-    db: AsyncSession,
     *,
     department: str,
     user_id: str,
@@ -26,123 +46,188 @@ async def record_cost(
     status: str,
     error_message: Optional[str] = None,
     timestamp: Optional[datetime] = None,
-) -> AIRequest:
-    """Persist a single LLM request record."""
-    record = AIRequest(
-        timestamp=timestamp or datetime.utcnow(),
-        department=department,
-        user_id=user_id,
-        model=model,
-        provider=provider,
-        task_tier=task_tier,
-        prompt_hash=prompt_hash,
-        input_tokens=input_tokens,
-        output_tokens=output_tokens,
-        total_tokens=total_tokens,
-        cost_usd=cost_usd,
-        latency_ms=latency_ms,
-        status=status,
-        error_message=error_message,
+) -> None:
+    """Queue a single LLM request record for the batched writer.
+
+    Without a running writer (e.g. outside the app lifespan) the record is
+    written straight away instead, so it is never left in the queue.
+    """
+    record = {
+        "timestamp": timestamp or datetime.utcnow(),
+        "department": department,
+        "user_id": user_id,
+        "model": model,
+        "provider": provider,
+        "task_tier": task_tier,
+        "prompt_hash": prompt_hash,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": total_tokens,
+        "cost_usd": cost_usd,
+        "latency_ms": latency_ms,
+        "status": status,
+        "error_message": error_message,
+    }
+    if _writer_running:
+        await _pending.put(record)
+    else:
+        await _write_with_retry([record])
+
+
+async def _write_records(batch: list[dict]) -> None:
+    # ORM add_all rather than a Core insert so the daily rollup hook sees the rows
+    async with async_session() as db:
+        db.add_all([AIRequest(**r) for r in batch])
+        await db.commit()
+
+
+async def _write_with_retry(records: list[dict]) -> None:
+    """Write records, retrying transient failures; count them as dropped if every attempt fails."""
+    global _dropped_records
+    for attempt in range(WRITE_ATTEMPTS):
+        try:
+            await _write_records(records)
+            return
+        except Exception:
+            if attempt + 1 < WRITE_ATTEMPTS:
+                logger.warning(f"Writing {len(records)} AI request records failed, retrying", exc_info=True)
+                await asyncio.sleep(WRITE_RETRY_BACKOFF_S * 2 ** attempt)
+            else:
+                logger.exception(f"Dropped {len(records)} AI request records after {WRITE_ATTEMPTS} attempts")
+    _dropped_records += len(records)
+
+
+def cost_writer_stats() -> dict:
+    """Queue depth and lost-record count of the request log writer."""
+    return {"running": _writer_running, "pending": _pending.qsize(), "dropped_records": _dropped_records}
+
+
+async def run_cost_writer() -> None:
+    """Write queued request records in batches (every WRITE_INTERVAL_S or WRITE_BATCH_SIZE rows).
+
+    Runs until stop_cost_writer() is called; records queued before the stop
+    are still written.
+    """
+    global _writer_running
+    loop = asyncio.get_running_loop()
+    stopping = False
+    _writer_running = True
+    try:
+        while not stopping:
+            batch = [await _pending.get()]
+            deadline = loop.time() + WRITE_INTERVAL_S
+            while len(batch) < WRITE_BATCH_SIZE and batch[-1] is not None:
+                try:
+                    batch.append(await asyncio.wait_for(_pending.get(), deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+
+            stopping = batch[-1] is None
+            records = [r for r in batch if r is not None]
+            if records:
+                await _write_with_retry(records)
+    finally:
+        _writer_running = False
+
+
+async def stop_cost_writer(task: asyncio.Task) -> None:
+    """Flush outstanding records and wait for the writer to exit."""
+    global _writer_running
+    # Records arriving from here on are written directly, not queued behind the stop
+    _writer_running = False
+    await _pending.put(None)
+    await task
+
+
+async def rebuild_daily_rollup(db: AsyncSession) -> None:
+    """Recompute ai_requests_daily from ai_requests (backfill for existing databases)."""
+    day = func.date(AIRequest.timestamp)
+    await db.execute(delete(AIRequestDaily))
+    await db.execute(
+        insert(AIRequestDaily).from_select(
+            ["date", "department", "model", "provider", "total_cost", "total_tokens",
+             "request_count", "sum_latency", "error_count"],
+            select(
+                day,
+                AIRequest.department,
+                AIRequest.model,
+                AIRequest.provider,
+                func.sum(AIRequest.cost_usd),
+                func.sum(AIRequest.total_tokens),
+                func.count(AIRequest.id),
+                func.sum(AIRequest.latency_ms),
+                func.sum(case((AIRequest.status != "success", 1), else_=0)),
+            ).group_by(day, AIRequest.department, AIRequest.model, AIRequest.provider),
+        )
     )
-    db.add(record)
     await db.commit()
-    await db.refresh(record)
-    return record
 
 
-async def get_cost_summary(
-    db: AsyncSession,
-    *,
-    days: int = 30,
-    department: Optional[str] = None,
-) -> dict:
+# Dashboard polls hit identical windows; a minute of staleness is fine for
+# append-only usage data
+@async_ttl_cache(60)
+async def get_cost_summary(*, days: int = 30, department: Optional[str] = None) -> dict:
     """Aggregate costs by department and model for the last N days."""
-    cutoff = datetime.utcnow() - timedelta(days=days)
-    filters = [AIRequest.timestamp >= cutoff]
+    # Concurrent callers share this computation, so it runs on a session of
+    # its own rather than any one request's
+    async with async_session() as db:
+        return await _cost_summary(db, days=days, department=department)
+
+
+async def _cost_summary(db: AsyncSession, *, days: int, department: Optional[str]) -> dict:
+    # Aggregates read the daily rollup, so the window starts at the cutoff's day
+    cutoff = (datetime.utcnow() - timedelta(days=days)).date()
+    filters = [AIRequestDaily.date >= cutoff]
     if department:
-        filters.append(AIRequest.department == department)
+        filters.append(AIRequestDaily.department == department)
+
+    # Rounding and chargeback shares are computed in SQL so rows are ready to serialize
+    cost = func.sum(AIRequestDaily.total_cost)
+    total_cost = func.round(func.coalesce(cost, 0), 4).label("total_cost")
+    total_tokens = func.coalesce(func.sum(AIRequestDaily.total_tokens), 0).label("total_tokens")
+    request_count = func.sum(AIRequestDaily.request_count).label("request_count")
 
-    # Department breakdown
+    # Department breakdown, with each department's share of the overall total
     dept_stmt = (
         select(
-            AIRequest.department,
-            func.sum(AIRequest.cost_usd).label("total_cost"),
-            func.sum(AIRequest.total_tokens).label("total_tokens"),
-            func.count(AIRequest.id).label("request_count"),
+            AIRequestDaily.department,
+            total_cost,
+            total_tokens,
+            request_count,
+            func.coalesce(func.round(cost * 100.0 / func.sum(cost).over(), 2), 0).label("share_pct"),
         )
         .where(and_(*filters))
-        .group_by(AIRequest.department)
-        .order_by(func.sum(AIRequest.cost_usd).desc())
+        .group_by(AIRequestDaily.department)
+        .order_by(cost.desc())
     )
-    dept_result = await db.execute(dept_stmt)
-    by_department = [
-        {
-            "department": row.department,
-            "total_cost": round(row.total_cost or 0, 4),
-            "total_tokens": row.total_tokens or 0,
-            "request_count": row.request_count,
-        }
-        for row in dept_result.all()
-    ]
+    by_department = []
+    chargeback = []
+    for row in (await db.execute(dept_stmt)).all():
+        dept = dict(row._mapping)
+        share_pct = dept.pop("share_pct")
+        by_department.append(dept)
+        chargeback.append({"department": dept["department"], "cost": dept["total_cost"], "share_pct": share_pct})
 
     # Model breakdown
     model_stmt = (
-        select(
-            AIRequest.model,
-            AIRequest.provider,
-            func.sum(AIRequest.cost_usd).label("total_cost"),
-            func.sum(AIRequest.total_tokens).label("total_tokens"),
-            func.count(AIRequest.id).label("request_count"),
-        )
+        select(AIRequestDaily.model, AIRequestDaily.provider, total_cost, total_tokens, request_count)
         .where(and_(*filters))
-        .group_by(AIRequest.model, AIRequest.provider)
-        .order_by(func.sum(AIRequest.cost_usd).desc())
+        .group_by(AIRequestDaily.model, AIRequestDaily.provider)
+        .order_by(cost.desc())
     )
-    model_result = await db.execute(model_stmt)
-    by_model = [
-        {
-            "model": row.model,
-            "provider": row.provider,
-            "total_cost": round(row.total_cost or 0, 4),
-            "total_tokens": row.total_tokens or 0,
-            "request_count": row.request_count,
-        }
-        for row in model_result.all()
-    ]
+    by_model = [dict(row._mapping) for row in (await db.execute(model_stmt)).all()]
 
     # Daily trend
     daily_stmt = (
-        select(
-            func.date(AIRequest.timestamp).label("date"),
-            func.sum(AIRequest.cost_usd).label("total_cost"),
-            func.count(AIRequest.id).label("request_count"),
-        )
+        select(type_coerce(AIRequestDaily.date, String).label("date"), total_cost, request_count)
         .where(and_(*filters))
-        .group_by(func.date(AIRequest.timestamp))
-        .order_by(func.date(AIRequest.timestamp))
+        .group_by(AIRequestDaily.date)
+        .order_by(AIRequestDaily.date)
     )
-    daily_result = await db.execute(daily_stmt)
-    daily_trend = [
-        {
-            "date": str(row.date),
-            "total_cost": round(row.total_cost or 0, 4),
-            "request_count": row.request_count,
-        }
-        for row in daily_result.all()
-    ]
+    daily_trend = [dict(row._mapping) for row in (await db.execute(daily_stmt)).all()]
 
     grand_total = sum(d["total_cost"] for d in by_department)
 
-    # Chargeback allocation (percentage of total)
-    chargeback = [
-        {
-            "department": d["department"],
-            "cost": d["total_cost"],
-            "share_pct": round(d["total_cost"] / grand_total * 100, 2) if grand_total > 0 else 0,
-        }
-        for d in by_department
-    ]
-
     return {
         "period_days": days,
         "grand_total_usd": round(grand_total, 4),
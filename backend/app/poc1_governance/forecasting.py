@@ -3,10 +3,16 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import select, func, and_
+import numpy as np
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import AIRequest
+from ..cache import async_ttl_cache
+from ..database import async_session
+from ..models import AIRequestDaily
+
+# Forecast horizons in days; each is a prefix of the longest projection
+FORECAST_HORIZONS = (30, 60, 90)
 
 # Budget alert thresholds
 BUDGET_ALERT_THRESHOLDS = [
@@ -15,25 +21,32 @@ BUDGET_ALERT_THRESHOLDS = [
 ]
 
 
+@async_ttl_cache(60)
 async def get_forecast(
-    db: AsyncSession,
     *,
     history_days: int = 60,
     monthly_budget_usd: Optional[float] = 10000.0,
 ) -> dict:
     """Forecast 30/60/90 day token spend using historical daily costs."""
-    cutoff = datetime.utcnow() - timedelta(days=history_days)
+    # Shared between concurrent callers, so it reads on its own session
+    async with async_session() as db:
+        return await _forecast(db, history_days=history_days, monthly_budget_usd=monthly_budget_usd)
+
+
+async def _forecast(db: AsyncSession, *, history_days: int, monthly_budget_usd: Optional[float]) -> dict:
+    now = datetime.utcnow()
+    cutoff = (now - timedelta(days=history_days)).date()
 
     daily_stmt = (
         select(
-            func.date(AIRequest.timestamp).label("date"),
-            func.sum(AIRequest.cost_usd).label("daily_cost"),
-            func.sum(AIRequest.total_tokens).label("daily_tokens"),
-            func.count(AIRequest.id).label("daily_requests"),
+            AIRequestDaily.date,
+            func.sum(AIRequestDaily.total_cost).label("daily_cost"),
+            func.sum(AIRequestDaily.total_tokens).label("daily_tokens"),
+            func.sum(AIRequestDaily.request_count).label("daily_requests"),
         )
-        .where(AIRequest.timestamp >= cutoff)
-        .group_by(func.date(AIRequest.timestamp))
-        .order_by(func.date(AIRequest.timestamp))
+        .where(AIRequestDaily.date >= cutoff)
+        .group_by(AIRequestDaily.date)
+        .order_by(AIRequestDaily.date)
     )
     result = await db.execute(daily_stmt)
     rows = result.all()
@@ -42,18 +55,15 @@ async def get_forecast(
         return _empty_forecast(monthly_budget_usd)
 
     daily_costs = [float(r.daily_cost or 0) for r in rows]
+    np_costs = np.asarray(daily_costs, dtype=np.float64)
     daily_tokens = [int(r.daily_tokens or 0) for r in rows]
     dates = [str(r.date) for r in rows]
 
     # Linear regression forecast
-    linear_30 = _linear_forecast(daily_costs, 30)
-    linear_60 = _linear_forecast(daily_costs, 60)
-    linear_90 = _linear_forecast(daily_costs, 90)
+    linear_30, linear_60, linear_90 = _linear_forecast(np_costs, FORECAST_HORIZONS)
 
     # Exponential smoothing forecast
-    ema_30 = _ema_forecast(daily_costs, 30)
-    ema_60 = _ema_forecast(daily_costs, 60)
-    ema_90 = _ema_forecast(daily_costs, 90)
+    ema_30, ema_60, ema_90 = _ema_forecast(np_costs, FORECAST_HORIZONS)
 
     # Blended (average of linear and EMA)
     blend_30 = round((linear_30 + ema_30) / 2, 2)
@@ -61,10 +71,10 @@ async def get_forecast(
     blend_90 = round((linear_90 + ema_90) / 2, 2)
 
     # Current month spend so far
-    month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    month_start = now.date().replace(day=1)
     mtd_stmt = (
-        select(func.sum(AIRequest.cost_usd).label("mtd_cost"))
-        .where(AIRequest.timestamp >= month_start)
+        select(func.sum(AIRequestDaily.total_cost).label("mtd_cost"))
+        .where(AIRequestDaily.date >= month_start)
     )
     mtd_result = await db.execute(mtd_stmt)
     mtd_cost = float(mtd_result.scalar() or 0)
@@ -116,42 +126,39 @@ async def get_forecast(
     }
 
 
-def _linear_forecast(values: list[float], days: int) -> float:
-    """Simple linear regression to project cumulative cost over N days."""
+def _linear_forecast(values: np.ndarray, horizons: tuple[int, ...]) -> list[float]:
+    """Simple linear regression to project cumulative cost over each horizon (days)."""
     n = len(values)
     if n == 0:
-        return 0.0
+        return [0.0 for _ in horizons]
     if n == 1:
-        return round(values[0] * days, 2)
+        return [round(float(values[0]) * days, 2) for days in horizons]
 
     # Least squares: y = a + b*x where x = 0..n-1
-    x_mean = (n - 1) / 2
-    y_mean = sum(values) / n
-    numerator = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
-    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    x = np.arange(n) - (n - 1) / 2
+    y_mean = values.mean()
+    b = float((x * (values - y_mean)).sum() / (x * x).sum())
+    a = y_mean - b * (n - 1) / 2
 
-    if denominator == 0:
-        b = 0.0
-    else:
-        b = numerator / denominator
-    a = y_mean - b * x_mean
+    # One projection out to the longest horizon; shorter ones are its prefix sums
+    projected = np.clip(a + b * np.arange(n, n + max(horizons)), 0, None)
+    cumulative = np.cumsum(projected)
+    return [round(float(cumulative[days - 1]), 2) for days in horizons]
 
-    # Sum projected daily costs for the next `days` days
-    total = sum(max(a + b * (n + d), 0) for d in range(days))
-    return round(total, 2)
 
+def _ema_forecast(values: np.ndarray, horizons: tuple[int, ...], alpha: float = 0.3) -> list[float]:
+    """Exponential moving average forecast over each horizon (days)."""
+    n = len(values)
+    if n == 0:
+        return [0.0 for _ in horizons]
 
-def _ema_forecast(values: list[float], days: int, alpha: float = 0.3) -> float:
-    """Exponential moving average forecast."""
-    if not values:
-        return 0.0
-
-    ema = values[0]
-    for v in values[1:]:
-        ema = alpha * v + (1 - alpha) * ema
+    # Unrolled recurrence ema = alpha*v + (1-alpha)*ema, seeded with values[0]
+    weights = alpha * (1 - alpha) ** np.arange(n - 1, -1, -1)
+    weights[0] = (1 - alpha) ** (n - 1)
+    ema = float(weights @ values)
 
     # Project the current EMA rate forward
-    return round(ema * days, 2)
+    return [round(ema * days, 2) for days in horizons]
 
 
 def _empty_forecast(budget: Optional[float]) -> dict:
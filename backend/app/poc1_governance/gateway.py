@@ -1,8 +1,11 @@
 """LiteLLM multi-model routing with tier-based selection and fallback chains."""
 
+import asyncio
+import functools
 import hashlib
+import random
 import time
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import litellm
 
@@ -32,27 +35,60 @@ PROVIDER_FOR_MODEL = {
 }
 
 
-def _provider_name(model: str) -> str:
-    return PROVIDER_FOR_MODEL.get(model, "unknown")
+# Retry backoff: base * 2**attempt plus up to `base` of jitter
+RETRY_BASE_DELAY_S = 0.1
 
+# Circuit breaker: skip a model for BREAKER_COOLDOWN_S after
+# BREAKER_THRESHOLD consecutive failures
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN_S = 30.0
 
-def _get_api_key(model: str) -> Optional[str]:
+# model -> (consecutive failures, open until monotonic time)
+_breaker: dict[str, tuple[int, float]] = {}
+
+
+class ModelInfo(NamedTuple):
+    provider: str
+    api_key: Optional[str]
+    input_price: float
+    output_price: float
+
+
+_UNKNOWN_MODEL = ModelInfo("unknown", None, 0.0, 0.0)
+
+
+@functools.cache
+def _model_table() -> dict[str, ModelInfo]:
+    """Provider, API key and per-token prices for each model, resolved once from settings."""
     settings = get_settings()
-    provider = _provider_name(model)
-    return {
+    api_keys = {
         "openai": settings.openai_api_key,
         "anthropic": settings.anthropic_api_key,
         "google": settings.google_api_key,
-    }.get(provider)
+    }
+    table = {}
+    for model, pricing in MODEL_PRICING.items():
+        provider = PROVIDER_FOR_MODEL.get(model, "unknown")
+        table[model] = ModelInfo(provider, api_keys.get(provider), pricing["input"], pricing["output"])
+    return table
+
+
+def _model_info(model: str) -> ModelInfo:
+    return _model_table().get(model, _UNKNOWN_MODEL)
 
 
 def compute_cost(model: str, input_tokens: int, output_tokens: int) -> float:
-    pricing = MODEL_PRICING.get(model, {"input": 0.0, "output": 0.0})
-    return input_tokens * pricing["input"] + output_tokens * pricing["output"]
+    info = _model_info(model)
+    return input_tokens * info.input_price + output_tokens * info.output_price
+
+
+_sha256 = hashlib.sha256
 
 
 def hash_prompt(prompt: str) -> str:
-    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    # Not memoized: a cache keyed on the prompt would keep raw prompt text in
+    # memory, when only this digest is meant to be retained
+    return _sha256(prompt.encode("utf-8")).hexdigest()
 
 
 async def route_completion(
@@ -69,14 +105,21 @@ async def route_completion(
     last_error: Optional[str] = None
 
     for model in models:
-        api_key = _get_api_key(model)
+        failures, open_until = _breaker.get(model, (0, 0.0))
+        if time.monotonic() < open_until:
+            last_error = last_error or f"{model}: circuit open after {failures} consecutive failures"
+            continue
+
+        info = _model_info(model)
         for attempt in range(max_retries):
+            if attempt:
+                await asyncio.sleep(RETRY_BASE_DELAY_S * (2 ** attempt + random.random()))
             start = time.perf_counter()
             try:
                 response = await litellm.acompletion(
                     model=model,
                     messages=messages,
-                    api_key=api_key or None,
+                    api_key=info.api_key or None,
                     timeout=30,
                 )
                 elapsed_ms = (time.perf_counter() - start) * 1000
@@ -84,11 +127,12 @@ async def route_completion(
                 input_tokens = usage.prompt_tokens or 0
                 output_tokens = usage.completion_tokens or 0
                 total_tokens = input_tokens + output_tokens
-                cost = compute_cost(model, input_tokens, output_tokens)
+                cost = input_tokens * info.input_price + output_tokens * info.output_price
+                _breaker.pop(model, None)
 
                 return {
                     "model": model,
-                    "provider": _provider_name(model),
+                    "provider": info.provider,
                     "response_text": response.choices[0].message.content,
                     "input_tokens": input_tokens,
                     "output_tokens": output_tokens,
@@ -101,11 +145,19 @@ async def route_completion(
             except Exception as exc:
                 last_error = f"{model} attempt {attempt + 1}: {exc}"
                 elapsed_ms = (time.perf_counter() - start) * 1000
+                # Count from the current state: concurrent calls may have
+                # recorded failures (or a success) since this one started
+                failures = _breaker.get(model, (0, 0.0))[0] + 1
+                if failures >= BREAKER_THRESHOLD:
+                    # Stop retrying a failing model; later requests skip it until cooldown ends
+                    _breaker[model] = (failures, time.monotonic() + BREAKER_COOLDOWN_S)
+                    break
+                _breaker[model] = (failures, 0.0)
 
     # All models and retries exhausted
     return {
         "model": models[0],
-        "provider": _provider_name(models[0]),
+        "provider": _model_info(models[0]).provider,
         "response_text": None,
         "input_tokens": 0,
         "output_tokens": 0,
@@ -2,7 +2,8 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,9 +12,9 @@ from .gateway import route_completion, hash_prompt
 from .cost_tracker import record_cost, get_cost_summary
 from .sla_monitor import get_sla_metrics
 from .forecasting import get_forecast
-from .audit_log import get_audit_log
+from .audit_log import get_audit_log, stream_audit_export
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # --- Request / Response schemas ---
@@ -38,21 +39,20 @@ class ChatResponse(BaseModel):
 
 
 # --- Endpoints ---
+# Large read payloads are returned as ORJSONResponse directly: returning the
+# dict would still send it through jsonable_encoder before orjson renders it.
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat(req: ChatRequest, db: AsyncSession = Depends(get_db)):
+async def chat(req: ChatRequest):
     """Send a message through the AI gateway with tier-based routing."""
     messages = [{"role": "user", "content": req.message}]
-    result = route_completion(
+    result = await route_completion(
         messages=messages,
         task_tier=req.task_tier,
     )
-    # route_completion is async
-    result = await result
 
-    # Record in DB for cost tracking + audit
+    # Queue for cost tracking + audit; the batched writer persists it
     await record_cost(
-        db,
         department=req.department,
         user_id=req.user_id,
         model=result["model"],
@@ -89,10 +89,9 @@ async def chat(req: ChatRequest, db: AsyncSession = Depends(get_db)):
 async def costs(
     days: int = Query(30, ge=1, le=365),
     department: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
 ):
     """Get cost summary with department/model breakdowns and chargeback."""
-    return await get_cost_summary(db, days=days, department=department)
+    return ORJSONResponse(await get_cost_summary(days=days, department=department))
 
 
 @router.get("/sla")
@@ -100,20 +99,18 @@ async def sla(
     days: int = Query(7, ge=1, le=90),
     department: Optional[str] = Query(None),
     model: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
 ):
     """Get SLA metrics: latency percentiles, error rates, uptime."""
-    return await get_sla_metrics(db, days=days, department=department, model=model)
+    return await get_sla_metrics(days=days, department=department, model=model)
 
 
 @router.get("/forecast")
 async def forecast(
     history_days: int = Query(60, ge=7, le=180),
     monthly_budget: Optional[float] = Query(10000.0, ge=0),
-    db: AsyncSession = Depends(get_db),
 ):
     """Get token spend forecast with 30/60/90 day projections."""
-    return await get_forecast(db, history_days=history_days, monthly_budget_usd=monthly_budget)
+    return ORJSONResponse(await get_forecast(history_days=history_days, monthly_budget_usd=monthly_budget))
 
 
 @router.get("/audit")
@@ -124,10 +121,28 @@ async def audit(
     status: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
     """Get ISO 42001-aligned audit log of AI requests."""
-    return await get_audit_log(
-        db, days=days, department=department,
-        model=model, status=status, limit=limit, offset=offset,
+    try:
+        return ORJSONResponse(await get_audit_log(
+            db, days=days, department=department,
+            model=model, status=status, limit=limit, offset=offset, cursor=cursor,
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+
+@router.get("/audit/export")
+async def audit_export(
+    days: int = Query(30, ge=1, le=365),
+    department: Optional[str] = Query(None),
+    model: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+):
+    """Stream the full filtered audit log as NDJSON (one entry per line)."""
+    return StreamingResponse(
+        stream_audit_export(days=days, department=department, model=model, status=status),
+        media_type="application/x-ndjson",
     )
@@ -4,14 +4,16 @@ Generates 2-3 months of simulated LLM usage across departments so the
 dashboard has data on first load.
 """
 
-import hashlib
-import random
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from itertools import islice
+from typing import Iterator
 
-from sqlalchemy import select, func
+import numpy as np
+from sqlalchemy import insert, select, func
 
 from ..database import async_session
-from ..models import AIRequest
+from ..models import AIRequest, AIRequestDaily
+from .cost_tracker import rebuild_daily_rollup
 from .gateway import MODEL_PRICING
 
 # Department usage distribution (relative weights)
@@ -73,29 +75,80 @@ DEPT_TIER_DIST = {
     "Legal": {"simple": 20, "moderate": 30, "complex": 50},
 }
 
-SAMPLE_PROMPTS = [
-    "Summarize the quarterly report",
-    "Generate test cases for the auth module",
-    "Draft an email to the client about the feature update",
-    "Analyze customer feedback sentiment",
-    "Explain the architecture of the payment service",
-    "Create a SQL query for user analytics",
-    "Review this code for security vulnerabilities",
-    "Write documentation for the API endpoint",
-    "Translate this marketing copy to Spanish",
-    "Help debug this Python traceback",
-]
-
-
-def _weighted_choice(weights: dict) -> str:
-    items = list(weights.keys())
-    w = list(weights.values())
-    return random.choices(items, weights=w, k=1)[0]
+# Weekday request volume by hour of day (business hours, some off-hours)
+WEEKDAY_HOUR_WEIGHTS = [1, 0, 0, 0, 0, 1, 2, 5, 10, 12, 12, 10,
+                        8, 10, 12, 11, 9, 7, 4, 3, 2, 1, 1, 1]
+
+
+def _alias_table(weights: list[float]) -> tuple[list[float], list[int]]:
+    """Build a Walker/Vose alias table for O(1) sampling from a weighted distribution."""
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    return prob, alias
+
+
+def _alias_tables(dists: list[list[float]]) -> tuple[np.ndarray, np.ndarray]:
+    """Stack one alias table per distribution into (prob, alias) arrays of shape (tables, k)."""
+    tables = [_alias_table(weights) for weights in dists]
+    return (
+        np.array([prob for prob, _ in tables]),
+        np.array([alias for _, alias in tables]),
+    )
+
+
+def _alias_sample(rng: np.random.Generator, tables: tuple[np.ndarray, np.ndarray], rows: np.ndarray) -> np.ndarray:
+    """Draw one outcome index per entry of ``rows``, each from its own table."""
+    prob, alias = tables
+    i = rng.integers(prob.shape[1], size=len(rows))
+    return np.where(rng.random(len(rows)) < prob[rows, i], i, alias[rows, i])
+
+
+# Static distributions, built once; table rows and columns follow these orderings
+_DEPT_NAMES = tuple(DEPARTMENTS)
+_MODEL_NAMES = tuple(MODELS)
+_TIER_NAMES = tuple(TIER_MODEL_WEIGHTS)
+_TIER_TABLES = _alias_tables([[DEPT_TIER_DIST[d].get(t, 0) for t in _TIER_NAMES] for d in _DEPT_NAMES])
+_MODEL_TABLES = _alias_tables([[TIER_MODEL_WEIGHTS[t].get(m, 0) for m in _MODEL_NAMES] for t in _TIER_NAMES])
+_HOUR_TABLES = _alias_tables([WEEKDAY_HOUR_WEIGHTS])
+
+# Per-model parameters as arrays, gathered per row by model index
+_MODEL_PARAMS = {
+    key: np.array([MODELS[m][key] for m in _MODEL_NAMES])
+    for key in ("input_range", "output_range", "latency_range")
+}
+_INPUT_PRICE = np.array([MODEL_PRICING.get(m, {}).get("input", 0.0) for m in _MODEL_NAMES])
+_OUTPUT_PRICE = np.array([MODEL_PRICING.get(m, {}).get("output", 0.0) for m in _MODEL_NAMES])
+
+# Base daily request counts per department (will vary day to day)
+DEPT_BASE_DAILY = {
+    "Engineering": 45,
+    "Sales": 25,
+    "Marketing": 20,
+    "Support": 20,
+    "Product": 12,
+    "Legal": 6,
+}
 
+# Rows per executemany while seeding
+SEED_INSERT_BATCH = 1000
 
-def _compute_cost(model: str, input_tokens: int, output_tokens: int) -> float:
-    pricing = MODEL_PRICING.get(model, {"input": 0.0, "output": 0.0})
-    return round(input_tokens * pricing["input"] + output_tokens * pricing["output"], 6)
+ERROR_MESSAGES = [
+    "Rate limit exceeded",
+    "Model overloaded",
+    "Invalid response format",
+    "Context length exceeded",
+]
 
 
 async def seed_if_empty():
@@ -112,119 +165,105 @@ async def seed_if_empty():
             db_models = {row[0] for row in distinct_models}
             expected_models = set(MODELS.keys())
             if db_models == expected_models:
-                return  # Already seeded with current models
+                # Already seeded with current models; backfill the rollup if it predates it
+                rollup_rows = (await db.execute(select(func.count(AIRequestDaily.id)))).scalar()
+                if not rollup_rows:
+                    await rebuild_daily_rollup(db)
+                return
 
             # Stale model names — delete and reseed
             from sqlalchemy import delete
             await db.execute(delete(AIRequest))
-            await db.flush()
-
-        records = _generate_records()
-        db.add_all(records)
-        await db.commit()
-
-
-def _generate_records() -> list[AIRequest]:
-    """Generate 2-3 months of realistic AI usage data."""
-    random.seed(42)  # Reproducible
-    records = []
-    now = datetime.utcnow()
-    start = now - timedelta(days=75)
-
-    # Base daily request counts per department (will vary day to day)
-    dept_base_daily = {
-        "Engineering": 45,
-        "Sales": 25,
-        "Marketing": 20,
-        "Support": 20,
-        "Product": 12,
-        "Legal": 6,
-    }
-
-    current_day = start
-    while current_day < now:
-        is_weekend = current_day.weekday() >= 5
-        day_multiplier = 0.2 if is_weekend else 1.0
-
-        # Slight upward trend over time (adoption growth)
-        days_elapsed = (current_day - start).days
-        growth = 1.0 + (days_elapsed / 75) * 0.3  # 30% growth over period
-
-        for dept, base_count in dept_base_daily.items():
-            daily_count = int(base_count * day_multiplier * growth * random.uniform(0.7, 1.3))
-            tier_dist = DEPT_TIER_DIST[dept]
-            users = DEPARTMENTS[dept]["users"]
-
-            for _ in range(daily_count):
-                tier = _weighted_choice(tier_dist)
-                model_weights = TIER_MODEL_WEIGHTS[tier]
-                model = _weighted_choice(model_weights)
-                mcfg = MODELS[model]
-
-                input_tokens = random.randint(*mcfg["input_range"])
-                output_tokens = random.randint(*mcfg["output_range"])
-                total_tokens = input_tokens + output_tokens
-                cost = _compute_cost(model, input_tokens, output_tokens)
-
-                # Latency with occasional spikes
-                base_latency = random.uniform(*mcfg["latency_range"])
-                if random.random() < 0.03:  # 3% chance of latency spike
-                    base_latency *= random.uniform(2, 5)
-                latency_ms = round(base_latency, 1)
-
-                # Status: ~2% error rate, ~0.5% timeout
-                roll = random.random()
-                if roll < 0.005:
-                    status = "timeout"
-                    error_message = "Request timed out after 30000ms"
-                elif roll < 0.025:
-                    status = "error"
-                    error_message = random.choice([
-                        "Rate limit exceeded",
-                        "Model overloaded",
-                        "Invalid response format",
-                        "Context length exceeded",
-                    ])
-                else:
-                    status = "success"
-                    error_message = None
-
-                prompt = random.choice(SAMPLE_PROMPTS)
-                prompt_hash = hashlib.sha256(
-                    f"{prompt}-{random.randint(0, 999999)}".encode()
-                ).hexdigest()
-
-                # Random time within business hours (with some off-hours)
-                if is_weekend:
-                    hour = random.randint(10, 18)
-                else:
-                    hour = random.choices(
-                        range(24),
-                        weights=[1, 0, 0, 0, 0, 1, 2, 5, 10, 12, 12, 10,
-                                 8, 10, 12, 11, 9, 7, 4, 3, 2, 1, 1, 1],
-                        k=1,
-                    )[0]
-                minute = random.randint(0, 59)
-                second = random.randint(0, 59)
-                ts = current_day.replace(hour=hour, minute=minute, second=second, microsecond=0)
-
-                records.append(AIRequest(
-                    timestamp=ts,
-                    department=dept,
-                    user_id=random.choice(users),
-                    model=model,
-                    provider=mcfg["provider"],
-                    task_tier=tier,
-                    prompt_hash=prompt_hash,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    total_tokens=total_tokens,
-                    cost_usd=cost,
-                    latency_ms=latency_ms,
-                    status=status,
-                    error_message=error_message,
-                ))
-
-        current_day += timedelta(days=1)
-
-    return records
+
+        # Core executemany skips the identity map and unit of work; it also
+        # skips the rollup flush hook, so rebuild the rollup (and commit) in
+        # the same transaction
+        rows = _iter_records()
+        while chunk := list(islice(rows, SEED_INSERT_BATCH)):
+            await db.execute(insert(AIRequest), chunk)
+        await rebuild_daily_rollup(db)
+
+
+def _iter_records() -> Iterator[dict]:
+    """Generate 2-3 months of realistic AI usage data.
+
+    Every random column is drawn for all rows at once; the insert parameter
+    dicts are only built lazily, as the caller consumes them.
+    """
+    rng = np.random.default_rng(42)  # Reproducible
+    n_days = 75
+    start_ord = datetime.utcnow().toordinal() - n_days
+    day_ymd = [date.fromordinal(start_ord + d).timetuple()[:3] for d in range(n_days)]
+
+    # Per-day, per-department request counts
+    is_weekend = (start_ord + np.arange(n_days) + 6) % 7 >= 5  # date.weekday() from the ordinal
+    day_multiplier = np.where(is_weekend, 0.2, 1.0)
+    growth = 1.0 + np.arange(n_days) / 75 * 0.3  # 30% growth over period
+    base = np.array([DEPT_BASE_DAILY[d] for d in _DEPT_NAMES])
+    counts = (
+        base[None, :] * (day_multiplier * growth)[:, None] * rng.uniform(0.7, 1.3, (n_days, len(base)))
+    ).astype(np.int64).ravel()
+
+    # One entry per row, ordered by day then department
+    day_idx = np.repeat(np.repeat(np.arange(n_days), len(base)), counts)
+    dept_idx = np.repeat(np.tile(np.arange(len(base)), n_days), counts)
+    n = len(day_idx)
+
+    tier_idx = _alias_sample(rng, _TIER_TABLES, dept_idx)
+    model_idx = _alias_sample(rng, _MODEL_TABLES, tier_idx)
+
+    input_range = _MODEL_PARAMS["input_range"][model_idx]
+    output_range = _MODEL_PARAMS["output_range"][model_idx]
+    input_tokens = rng.integers(input_range[:, 0], input_range[:, 1] + 1)
+    output_tokens = rng.integers(output_range[:, 0], output_range[:, 1] + 1)
+    cost = np.round(input_tokens * _INPUT_PRICE[model_idx] + output_tokens * _OUTPUT_PRICE[model_idx], 6)
+
+    # Latency with occasional spikes (3% of requests)
+    latency_range = _MODEL_PARAMS["latency_range"][model_idx]
+    latency = rng.uniform(latency_range[:, 0], latency_range[:, 1])
+    spike = rng.random(n) < 0.03
+    latency = np.round(np.where(spike, latency * rng.uniform(2, 5, n), latency), 1)
+
+    # Status: ~2% error rate, ~0.5% timeout
+    roll = rng.random(n)
+    error_choice = rng.integers(len(ERROR_MESSAGES), size=n)
+
+    # Opaque stand-ins for prompt hashes: 32 random bytes per row, hex-encoded below
+    prompt_hash_bytes = rng.bytes(n * 32)
+
+    # Random time within business hours (with some off-hours)
+    weekday_hour = _alias_sample(rng, _HOUR_TABLES, np.zeros(n, dtype=np.int64))
+    hour = np.where(is_weekend[day_idx], rng.integers(10, 19, size=n), weekday_hour)
+    minute = rng.integers(0, 60, size=n)
+    second = rng.integers(0, 60, size=n)
+
+    user_count = np.array([len(DEPARTMENTS[d]["users"]) for d in _DEPT_NAMES])
+    user_choice = (rng.random(n) * user_count[dept_idx]).astype(np.int64)
+
+    return (
+        dict(
+            timestamp=datetime(*day_ymd[d], h, mi, sec),
+            department=_DEPT_NAMES[dept],
+            user_id=DEPARTMENTS[_DEPT_NAMES[dept]]["users"][user],
+            model=_MODEL_NAMES[m],
+            provider=MODELS[_MODEL_NAMES[m]]["provider"],
+            task_tier=_TIER_NAMES[tier],
+            prompt_hash=prompt_hash_bytes[i * 32:(i + 1) * 32].hex(),
+            input_tokens=inp,
+            output_tokens=out,
+            total_tokens=inp + out,
+            cost_usd=c,
+            latency_ms=lat,
+            status="timeout" if r < 0.005 else "error" if r < 0.025 else "success",
+            error_message=(
+                "Request timed out after 30000ms" if r < 0.005
+                else ERROR_MESSAGES[e] if r < 0.025
+                else None
+            ),
+        )
+        for i, (d, dept, user, m, tier, inp, out, c, lat, r, e, h, mi, sec) in enumerate(zip(
+            day_idx.tolist(), dept_idx.tolist(), user_choice.tolist(), model_idx.tolist(), tier_idx.tolist(),
+            input_tokens.tolist(), output_tokens.tolist(), cost.tolist(), latency.tolist(),
+            roll.tolist(), error_choice.tolist(), hour.tolist(), minute.tolist(), second.tolist(),
+        ))
+    )
@@ -1,11 +1,13 @@
 """SLA monitoring: latency percentiles, error rates, uptime, and alert thresholds."""
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import select, func, and_, case, cast, Float
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_, or_, case, cast, Integer
 
+from ..cache import async_ttl_cache
+from ..database import async_session
 from ..models import AIRequest
 
 # Default SLA thresholds
@@ -16,49 +18,52 @@ SLA_THRESHOLDS = {
     "uptime_pct": 99.0,       # 99% uptime target
 }
 
+# Latency percentiles reported as p50/p95/p99
+PERCENTILES = (50, 95, 99)
 
+
+@async_ttl_cache(60)
 async def get_sla_metrics(
-    db: AsyncSession,
     *,
     days: int = 7,
     department: Optional[str] = None,
     model: Optional[str] = None,
 ) -> dict:
     """Compute SLA metrics: latency percentiles, error rate, uptime."""
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    now = datetime.utcnow()
+    cutoff = now - timedelta(days=days)
     filters = [AIRequest.timestamp >= cutoff]
     if department:
         filters.append(AIRequest.department == department)
     if model:
         filters.append(AIRequest.model == model)
 
-    # Fetch all latencies for percentile calculation
-    latency_stmt = (
-        select(AIRequest.latency_ms)
-        .where(and_(*filters, AIRequest.status == "success"))
-        .order_by(AIRequest.latency_ms)
-    )
-    latency_result = await db.execute(latency_stmt)
-    latencies = [row[0] for row in latency_result.all()]
-
-    p50 = _percentile(latencies, 50)
-    p95 = _percentile(latencies, 95)
-    p99 = _percentile(latencies, 99)
-
-    # Total counts and error rate
-    count_stmt = (
+    # Totals plus the success-only latency ranks that each percentile
+    # interpolates between, in one round-trip; only those few rows come back
+    # instead of every latency
+    is_success = AIRequest.status == "success"
+    totals = (
         select(
             func.count(AIRequest.id).label("total"),
             func.sum(case((AIRequest.status != "success", 1), else_=0)).label("errors"),
+            func.sum(case((is_success, 1), else_=0)).label("successes"),
         )
         .where(and_(*filters))
+        .cte("totals")
+    )
+    ranked = (
+        select(
+            AIRequest.latency_ms,
+            (func.row_number().over(order_by=AIRequest.latency_ms) - 1).label("idx"),
+        )
+        .where(and_(*filters, is_success))
+        .cte("ranked")
+    )
+    lower_ranks = [cast(pct / 100 * (totals.c.successes - 1), Integer) for pct in PERCENTILES]
+    stmt = (
+        select(totals.c.total, totals.c.errors, totals.c.successes, ranked.c.idx, ranked.c.latency_ms)
+        .select_from(totals.outerjoin(ranked, or_(*(ranked.c.idx.between(r, r + 1) for r in lower_ranks))))
     )
-    count_result = await db.execute(count_stmt)
-    row = count_result.one()
-    total = row.total or 0
-    errors = row.errors or 0
-    error_rate = round((errors / total * 100) if total > 0 else 0, 2)
-    uptime = round(100 - error_rate, 2)
 
     # Per-model breakdown
     model_stmt = (
@@ -71,9 +76,51 @@ async def get_sla_metrics(
         .where(and_(*filters))
         .group_by(AIRequest.model)
     )
-    model_result = await db.execute(model_stmt)
+
+    # Hourly trend (last 24h or full period, whichever is shorter)
+    trend_cutoff = max(cutoff, now - timedelta(hours=72))
+    # Bucket rows by integer epoch hour, computed once per row; the readable
+    # hour label is only formatted once per bucket
+    hourly_buckets = (
+        select(
+            (cast(func.strftime("%s", AIRequest.timestamp), Integer) // 3600).label("bucket"),
+            AIRequest.latency_ms,
+            AIRequest.status,
+        )
+        .where(and_(AIRequest.timestamp >= trend_cutoff, *filters[1:]))
+        .subquery()
+    )
+    hourly_stmt = (
+        select(
+            func.strftime("%Y-%m-%d %H:00", hourly_buckets.c.bucket * 3600, "unixepoch").label("hour"),
+            func.count().label("count"),
+            func.avg(hourly_buckets.c.latency_ms).label("avg_latency"),
+            func.sum(case((hourly_buckets.c.status != "success", 1), else_=0)).label("errors"),
+        )
+        .group_by(hourly_buckets.c.bucket)
+        .order_by(hourly_buckets.c.bucket)
+    )
+
+    # The three reads are independent; a session runs one statement at a
+    # time, so each gets its own pooled session and all three run
+    # concurrently. None of them is a request's session, since concurrent
+    # callers share this computation.
+    rows, model_rows, hourly_rows = await asyncio.gather(
+        _fetch_all(stmt),
+        _fetch_all(model_stmt),
+        _fetch_all(hourly_stmt),
+    )
+
+    row = rows[0]
+    total = row.total or 0
+    errors = row.errors or 0
+    latency_at = {r.idx: r.latency_ms for r in rows if r.idx is not None}
+    p50, p95, p99 = (_percentile(latency_at, row.successes or 0, pct) for pct in PERCENTILES)
+    error_rate = round((errors / total * 100) if total > 0 else 0, 2)
+    uptime = round(100 - error_rate, 2)
+
     by_model = []
-    for r in model_result.all():
+    for r in model_rows:
         m_total = r.total or 0
         m_errors = r.errors or 0
         by_model.append({
@@ -84,20 +131,6 @@ async def get_sla_metrics(
             "avg_latency_ms": round(r.avg_latency or 0, 1),
         })
 
-    # Hourly trend (last 24h or full period, whichever is shorter)
-    trend_cutoff = max(cutoff, datetime.utcnow() - timedelta(hours=72))
-    hourly_stmt = (
-        select(
-            func.strftime("%Y-%m-%d %H:00", AIRequest.timestamp).label("hour"),
-            func.count(AIRequest.id).label("count"),
-            func.avg(AIRequest.latency_ms).label("avg_latency"),
-            func.sum(case((AIRequest.status != "success", 1), else_=0)).label("errors"),
-        )
-        .where(and_(AIRequest.timestamp >= trend_cutoff, *filters[1:]))
-        .group_by(func.strftime("%Y-%m-%d %H:00", AIRequest.timestamp))
-        .order_by(func.strftime("%Y-%m-%d %H:00", AIRequest.timestamp))
-    )
-    hourly_result = await db.execute(hourly_stmt)
     hourly_trend = [
         {
             "hour": r.hour,
@@ -105,7 +138,7 @@ async def get_sla_metrics(
             "avg_latency_ms": round(r.avg_latency or 0, 1),
             "error_count": r.errors or 0,
         }
-        for r in hourly_result.all()
+        for r in hourly_rows
     ]
 
     # Alert checks
@@ -137,13 +170,22 @@ async def get_sla_metrics(
     }
 
 
-def _percentile(sorted_values: list[float], pct: int) -> Optional[float]:
-    """Compute percentile from a pre-sorted list."""
-    if not sorted_values:
+async def _fetch_all(stmt) -> list:
+    """Run stmt on a fresh session from the pool and return every row."""
+    async with async_session() as db:
+        return (await db.execute(stmt)).all()
+
+
+def _percentile(latency_at: dict[int, float], n: int, pct: int) -> Optional[float]:
+    """Interpolate a percentile from the values at the ranks around it.
+
+    ``latency_at`` maps 0-based rank in the sorted values to the value; it
+    must hold both neighbouring ranks of ``pct / 100 * (n - 1)``.
+    """
+    if not n:
         return None
-    n = len(sorted_values)
-    idx = (pct / 100) * (n - 1)
+    idx = pct / 100 * (n - 1)
     lower = int(idx)
     upper = min(lower + 1, n - 1)
     frac = idx - lower
-    return round(sorted_values[lower] * (1 - frac) + sorted_values[upper] * frac, 1)
+    return round(latency_at[lower] * (1 - frac) + latency_at[upper] * frac, 1)
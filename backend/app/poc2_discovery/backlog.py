@@ -11,24 +11,30 @@ Converts scored & ranked workflows into product backlog items with:
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+import functools
+from dataclasses import dataclass
 
-from .scoring import ScoredWorkflow, ScoreWeights, rank_all
+from .scoring import ScoredWorkflow, ScoreWeights, get_current_weights, rank_all
 
 
 # ---------------------------------------------------------------------------
 # Models
 # ---------------------------------------------------------------------------
 
-class BacklogItem(BaseModel):
+# Plain slotted dataclasses: built in bulk here and validated only once, by
+# the response model at the route boundary
+@dataclass(slots=True, frozen=True)
+class BacklogItem:
     id: str
     workflow_id: str
     title: str
     user_story: str
     acceptance_criteria: list[str]
     effort: str  # S, M, L, XL
+    effort_hours: int  # planning hours for the effort size
     estimated_roi_usd: int
     composite_score: float
+    complexity_score: float  # implementation_complexity score, 10 = easiest
     jim_principles: list[str]
     department: str
     rank: int
@@ -52,6 +58,10 @@ _DEPARTMENT_ROLE: dict[str, str] = {
 }
 
 
+# Planning hours per effort size, used for roadmap phase capacity
+_EFFORT_HOURS: dict[str, int] = {"S": 35, "M": 55, "L": 85, "XL": 110}
+
+
 def _effort_from_hours(hours: int) -> str:
     if hours <= 40:
         return "S"
@@ -62,6 +72,14 @@ def _effort_from_hours(hours: int) -> str:
     return "XL"
 
 
+# Extra acceptance criterion per Jim principle, in the order they are listed
+_PRINCIPLE_CRITERIA: tuple[tuple[str, str], ...] = (
+    ("self_service", "End users can trigger and configure the automation without engineering involvement."),
+    ("deal_standardization", "Process follows standardized templates approved by Revenue Operations."),
+    ("unified_data", "All data sources are consolidated into a single view with no manual copy-paste."),
+)
+
+
 def _generate_acceptance_criteria(wf: ScoredWorkflow) -> list[str]:
     """Generate 3-5 acceptance criteria based on the workflow characteristics."""
     criteria: list[str] = []
@@ -76,18 +94,8 @@ def _generate_acceptance_criteria(wf: ScoredWorkflow) -> list[str]:
         "Automation includes error handling with Slack notification on failure."
     )
 
-    if "self_service" in wf.jim_principles:
-        criteria.append(
-            "End users can trigger and configure the automation without engineering involvement."
-        )
-    if "deal_standardization" in wf.jim_principles:
-        criteria.append(
-            "Process follows standardized templates approved by Revenue Operations."
-        )
-    if "unified_data" in wf.jim_principles:
-        criteria.append(
-            "All data sources are consolidated into a single view with no manual copy-paste."
-        )
+    principles = set(wf.jim_principles)
+    criteria.extend(text for principle, text in _PRINCIPLE_CRITERIA if principle in principles)
 
     # Ensure at least 3, at most 5
     return criteria[:5]
@@ -115,24 +123,35 @@ def _build_user_story(wf: ScoredWorkflow) -> str:
 # ---------------------------------------------------------------------------
 
 def generate_backlog(weights: ScoreWeights | None = None) -> list[BacklogItem]:
-    """Generate a full product backlog from scored workflows."""
+    """Generate a full product backlog from scored workflows.
+
+    Items are shared between calls with the same weights; treat them as read-only.
+    """
+    return list(_generate_backlog(weights or get_current_weights()))
+
+
+@functools.lru_cache(maxsize=32)
+def _generate_backlog(weights: ScoreWeights) -> tuple[BacklogItem, ...]:
     ranked = rank_all(weights)
     items: list[BacklogItem] = []
 
     for wf in ranked:
+        effort = _effort_from_hours(wf.estimated_build_hours)
         item = BacklogItem(
             id=f"BLI-{wf.id.replace('wf-', '')}",
             workflow_id=wf.id,
             title=wf.name,
             user_story=_build_user_story(wf),
             acceptance_criteria=_generate_acceptance_criteria(wf),
-            effort=_effort_from_hours(wf.estimated_build_hours),
+            effort=effort,
+            effort_hours=_EFFORT_HOURS[effort],
             estimated_roi_usd=wf.annual_cost_savings_usd,
             composite_score=wf.scores.composite,
+            complexity_score=wf.scores.implementation_complexity,
             jim_principles=wf.jim_principles,
             department=wf.department,
             rank=wf.rank,
         )
         items.append(item)
 
-    return items
+    return tuple(items)
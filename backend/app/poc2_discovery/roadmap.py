@@ -11,17 +11,21 @@ Each phase includes projected total ROI.
 
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
+
 from pydantic import BaseModel
 
 from .backlog import BacklogItem, generate_backlog
-from .scoring import ScoreWeights, rank_all
+from .scoring import ScoreWeights, get_current_weights
 
 
 # ---------------------------------------------------------------------------
 # Models
 # ---------------------------------------------------------------------------
 
-class RoadmapItem(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RoadmapItem:
     backlog_id: str
     workflow_id: str
     title: str
@@ -32,7 +36,8 @@ class RoadmapItem(BaseModel):
     jim_principles: list[str]
 
 
-class RoadmapPhase(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RoadmapPhase:
     phase: int
     name: str
     weeks: str
@@ -52,7 +57,24 @@ class Roadmap(BaseModel):
 # Helpers
 # ---------------------------------------------------------------------------
 
-_EFFORT_HOURS: dict[str, int] = {"S": 35, "M": 55, "L": 85, "XL": 110}
+# (name, weeks, description) for phases 1-3
+_PHASES: tuple[tuple[str, str, str], ...] = (
+    (
+        "Quick Wins",
+        "1-4",
+        "High-score, low-complexity automations that deliver immediate value and build momentum.",
+    ),
+    (
+        "Medium-Term",
+        "5-8",
+        "Solid-score automations requiring moderate integration effort; builds on Quick Win infrastructure.",
+    ),
+    (
+        "Strategic",
+        "9-12",
+        "Complex, high-value initiatives that require deeper integration or cross-functional coordination.",
+    ),
+)
 
 
 def _to_roadmap_item(bli: BacklogItem) -> RoadmapItem:
@@ -73,71 +95,48 @@ def _to_roadmap_item(bli: BacklogItem) -> RoadmapItem:
 # ---------------------------------------------------------------------------
 
 def build_roadmap(weights: ScoreWeights | None = None) -> Roadmap:
-    """Assign backlog items to 90-day phases."""
-    backlog = generate_backlog(weights)
-    scored_map = {sw.id: sw for sw in rank_all(weights)}
+    """Assign backlog items to 90-day phases.
+
+    The roadmap is shared between calls with the same weights; treat it as read-only.
+    """
+    return _build_roadmap(weights or get_current_weights())
 
-    quick_wins: list[BacklogItem] = []
-    medium_term: list[BacklogItem] = []
-    strategic: list[BacklogItem] = []
 
-    for bli in backlog:
-        sw = scored_map.get(bli.workflow_id)
-        complexity_score = sw.scores.implementation_complexity if sw else 5.0
+@functools.lru_cache(maxsize=32)
+def _build_roadmap(weights: ScoreWeights) -> Roadmap:
+    # One pass over the backlog: each item lands in its phase's bucket and
+    # that phase's ROI and hour totals are accumulated as it goes
+    items: tuple[list[RoadmapItem], list[RoadmapItem], list[RoadmapItem]] = ([], [], [])
+    total_roi = [0, 0, 0]
+    total_hours = [0, 0, 0]
 
-        if bli.composite_score >= 7.0 and complexity_score >= 6.0:
-            quick_wins.append(bli)
+    for bli in generate_backlog(weights):
+        if bli.composite_score >= 7.0 and bli.complexity_score >= 6.0:
+            bucket = 0  # Quick Wins
         elif bli.composite_score >= 5.0:
-            medium_term.append(bli)
+            bucket = 1  # Medium-Term
         else:
-            strategic.append(bli)
-
-    def _build_phase(
-        phase: int,
-        name: str,
-        weeks: str,
-        description: str,
-        items: list[BacklogItem],
-    ) -> RoadmapPhase:
-        ri = [_to_roadmap_item(b) for b in items]
-        total_roi = sum(b.estimated_roi_usd for b in items)
-        total_hours = sum(_EFFORT_HOURS.get(b.effort, 55) for b in items)
-        return RoadmapPhase(
-            phase=phase,
+            bucket = 2  # Strategic
+        items[bucket].append(_to_roadmap_item(bli))
+        total_roi[bucket] += bli.estimated_roi_usd
+        total_hours[bucket] += bli.effort_hours
+
+    phases = [
+        RoadmapPhase(
+            phase=i + 1,
             name=name,
             weeks=weeks,
             description=description,
-            items=ri,
-            total_roi_usd=total_roi,
-            total_build_hours=total_hours,
+            items=items[i],
+            total_roi_usd=total_roi[i],
+            total_build_hours=total_hours[i],
         )
-
-    phases = [
-        _build_phase(
-            1,
-            "Quick Wins",
-            "1-4",
-            "High-score, low-complexity automations that deliver immediate value and build momentum.",
-            quick_wins,
-        ),
-        _build_phase(
-            2,
-            "Medium-Term",
-            "5-8",
-            "Solid-score automations requiring moderate integration effort; builds on Quick Win infrastructure.",
-            medium_term,
-        ),
-        _build_phase(
-            3,
-            "Strategic",
-            "9-12",
-            "Complex, high-value initiatives that require deeper integration or cross-functional coordination.",
-            strategic,
-        ),
+        for i, (name, weeks, description) in enumerate(_PHASES)
     ]
 
-    return Roadmap(
+    # The route's response model validates this once on the way out
+    return Roadmap.model_construct(
         phases=phases,
-        total_roi_usd=sum(p.total_roi_usd for p in phases),
-        total_items=sum(len(p.items) for p in phases),
+        total_roi_usd=sum(total_roi),
+        total_items=sum(map(len, items)),
     )
@@ -11,7 +11,9 @@ Endpoints:
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import functools
+
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, Field
 
 from .scoring import (
@@ -76,15 +78,21 @@ class WeightsResponse(BaseModel):
 # Endpoints
 # ---------------------------------------------------------------------------
 
-@router.get("/departments", response_model=DepartmentsResponse)
-async def list_departments():
-    """Return all Gong departments with headcount and workflow metadata."""
+@functools.cache
+def _departments_json() -> bytes:
+    # Department metadata is static, so validate and serialize it once
     depts = get_departments()
     return DepartmentsResponse(
         departments=[DepartmentOut(**d) for d in depts],
         total_headcount=sum(d["headcount"] for d in depts),
         total_open_roles=sum(d["open_roles"] for d in depts),
-    )
+    ).model_dump_json().encode()
+
+
+@router.get("/departments", response_model=DepartmentsResponse)
+async def list_departments():
+    """Return all Gong departments with headcount and workflow metadata."""
+    return Response(content=_departments_json(), media_type="application/json")
 
 
 @router.get("/workflows", response_model=WorkflowsResponse)
@@ -102,7 +110,7 @@ async def list_workflows():
 async def get_backlog():
     """Generate the prioritized product backlog from scored workflows."""
     items = generate_backlog()
-    return BacklogResponse(
+    return BacklogResponse.model_construct(
         items=items,
         total_items=len(items),
         total_estimated_roi_usd=sum(i.estimated_roi_usd for i in items),
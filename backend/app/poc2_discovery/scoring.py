@@ -10,12 +10,16 @@ Dimensions:
 
 from __future__ import annotations
 
+import functools
 import json
 import math
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..numeric import round2
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
 WEIGHTS_FILE = DATA_DIR / "score_weights.json"
@@ -25,6 +29,9 @@ WEIGHTS_FILE = DATA_DIR / "score_weights.json"
 # ---------------------------------------------------------------------------
 
 class ScoreWeights(BaseModel):
+    # Frozen, hence hashable: backlog and roadmap results are cached per weights
+    model_config = ConfigDict(frozen=True)
+
     revenue_impact: float = Field(0.30, ge=0, le=1)
     headcount_pressure: float = Field(0.20, ge=0, le=1)
     implementation_complexity: float = Field(0.25, ge=0, le=1)
@@ -55,24 +62,16 @@ class ScoredWorkflow(BaseModel):
 # Data loaders (cached at module level on first call)
 # ---------------------------------------------------------------------------
 
-_departments: list[dict] | None = None
-_workflows: list[dict] | None = None
-
-
+@functools.cache
 def _load_departments() -> list[dict]:
-    global _departments
-    if _departments is None:
-        with open(DATA_DIR / "departments.json", encoding="utf-8") as f:
-            _departments = json.load(f)
-    return _departments
+    with open(DATA_DIR / "departments.json", encoding="utf-8") as f:
+        return json.load(f)
 
 
+@functools.cache
 def _load_workflows() -> list[dict]:
-    global _workflows
-    if _workflows is None:
-        with open(DATA_DIR / "workflows.json", encoding="utf-8") as f:
-            _workflows = json.load(f)
-    return _workflows
+    with open(DATA_DIR / "workflows.json", encoding="utf-8") as f:
+        return json.load(f)
 
 
 def get_departments() -> list[dict]:
@@ -102,6 +101,7 @@ _REVENUE_WEIGHT: dict[str, float] = {
 }
 
 
+@functools.cache
 def _dept_lookup() -> dict[str, dict]:
     return {d["id"]: d for d in _load_departments()}
 
@@ -149,6 +149,59 @@ def _score_self_service_potential(wf: dict) -> float:
     return round(min(base, 10), 2)
 
 
+# Bits of the per-workflow principle mask used by vectorized scoring
+_PRINCIPLE_BITS: dict[str, int] = {
+    "self_service": 1,
+    "deal_standardization": 2,
+    "unified_data": 4,
+    "do_not_automate": 8,
+}
+
+
+@functools.cache
+def _dimension_scores() -> np.ndarray:
+    """(N, 4) revenue/headcount/complexity/self-service scores, one row per workflow.
+
+    Array-op equivalent of the four _score_* helpers over _load_workflows();
+    only the final exact rounding (round2) is a per-element Python pass. The
+    dimensions don't depend on the weights, so this runs once per process.
+    """
+    workflows = _load_workflows()
+    depts = _dept_lookup()
+
+    dept_factor = np.array([_REVENUE_WEIGHT.get(wf["department"], 0.3) for wf in workflows])
+    savings = np.array([wf.get("annual_cost_savings_usd", 0) for wf in workflows], dtype=float)
+    hours = np.array([wf.get("estimated_build_hours", 80) for wf in workflows], dtype=float)
+    dept_rows = [depts.get(wf["department"]) for wf in workflows]
+    has_dept = np.array([d is not None for d in dept_rows])
+    open_roles = np.array([d["open_roles"] if d else 0 for d in dept_rows], dtype=float)
+    headcount = np.array([d["headcount"] if d else 1 for d in dept_rows], dtype=float)
+    mask = np.array([
+        sum(_PRINCIPLE_BITS.get(p, 0) for p in set(wf.get("jim_principles", [])))
+        for wf in workflows
+    ])
+
+    savings_factor = np.minimum(np.log10(np.maximum(savings, 1)) / math.log10(250_000), 1.0)
+    revenue = np.minimum(dept_factor * 5 + savings_factor * 5, 10)
+
+    ratio = open_roles / np.maximum(headcount, 1)
+    headcount_pressure = np.where(has_dept, np.minimum(ratio / 0.15 * 10, 10), 5.0)
+
+    complexity = np.clip(10 - ((hours - 20) / (120 - 20)) * 9, 1, 10)
+
+    self_service = (
+        3.0
+        + np.where(mask & _PRINCIPLE_BITS["self_service"], 4.0, 0.0)
+        + np.where(mask & _PRINCIPLE_BITS["deal_standardization"], 1.5, 0.0)
+        + np.where(mask & _PRINCIPLE_BITS["unified_data"], 1.0, 0.0)
+    )
+    self_service = np.minimum(np.where(mask & _PRINCIPLE_BITS["do_not_automate"], 1.0, self_service), 10)
+
+    scores = round2(np.column_stack([revenue, headcount_pressure, complexity, self_service]))
+    scores.flags.writeable = False
+    return scores
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -200,13 +253,51 @@ def score_workflow(wf: dict, weights: ScoreWeights | None = None) -> ScoredWorkf
 
 
 def rank_all(weights: ScoreWeights | None = None) -> list[ScoredWorkflow]:
-    """Score and rank every workflow, returning them sorted by composite score descending."""
-    w = weights or _current_weights
-    scored = [score_workflow(wf, w) for wf in _load_workflows()]
-    scored.sort(key=lambda s: s.scores.composite, reverse=True)
-    for idx, item in enumerate(scored, start=1):
-        item.rank = idx
-    return scored
+    """Score and rank every workflow, returning them sorted by composite score descending.
+
+    Results are shared between calls with the same weights; treat them as read-only.
+    """
+    return list(_rank_all(weights or _current_weights))
+
+
+@functools.lru_cache(maxsize=8)
+def _rank_all(w: ScoreWeights) -> tuple[ScoredWorkflow, ...]:
+    workflows = _load_workflows()
+    dims = _dimension_scores()
+    composite = round2(
+        w.revenue_impact * dims[:, 0]
+        + w.headcount_pressure * dims[:, 1]
+        + w.implementation_complexity * dims[:, 2]
+        + w.self_service_potential * dims[:, 3]
+    )
+    # Stable, so ties keep workflow file order
+    order = np.argsort(-composite, kind="stable")
+
+    # Only the final response needs Pydantic objects
+    dim_rows = dims.tolist()
+    composite_values = composite.tolist()
+    ranked = []
+    for rank, i in enumerate(order.tolist(), start=1):
+        wf = workflows[i]
+        ri, hp, ic, sp = dim_rows[i]
+        ranked.append(ScoredWorkflow(
+            id=wf["id"],
+            name=wf["name"],
+            department=wf["department"],
+            description=wf["description"],
+            scores=WorkflowScores(
+                revenue_impact=ri,
+                headcount_pressure=hp,
+                implementation_complexity=ic,
+                self_service_potential=sp,
+                composite=composite_values[i],
+            ),
+            annual_cost_savings_usd=wf["annual_cost_savings_usd"],
+            estimated_build_hours=wf["estimated_build_hours"],
+            jim_principles=wf.get("jim_principles", []),
+            rank=rank,
+        ))
+    return tuple(ranked)
 
 
 def update_weights(new_weights: ScoreWeights) -> ScoreWeights:
@@ -7,23 +7,24 @@ ISO 42001 Annex A controls based on the risk profile.
 
 from __future__ import annotations
 
+import functools
 import json
 import math
 from pathlib import Path
 
-DATA_DIR = Path(__file__).resolve().parent / "data"
+import numpy as np
 
-# ---- Controls data (loaded once) -------------------------------------------
+from ..numeric import round2
+from ..poc2_discovery.scoring import get_workflows
 
-_controls: list[dict] | None = None
+DATA_DIR = Path(__file__).resolve().parent / "data"
 
+# ---- Controls data (loaded once) -------------------------------------------
 
+@functools.cache
 def _load_controls() -> list[dict]:
-    global _controls
-    if _controls is None:
-        with open(DATA_DIR / "controls.json", encoding="utf-8") as f:
-            _controls = json.load(f)
-    return _controls
+    with open(DATA_DIR / "controls.json", encoding="utf-8") as f:
+        return json.load(f)
 
 
 # ---- Constants for scoring -------------------------------------------------
@@ -43,18 +44,35 @@ _STAKEHOLDER_BASE: dict[str, float] = {
 }
 
 # Tools that handle PII or sensitive personal data
-_PII_TOOLS = {
+_PII_TOOLS = frozenset({
     "Workday", "Salesforce", "Greenhouse", "LinkedIn Sales Navigator",
     "Gainsight", "Lattice", "Pendo",
-}
+})
 
 # Tools with compliance / legal implications
-_COMPLIANCE_TOOLS = {
+_COMPLIANCE_TOOLS = frozenset({
     "DocuSign", "Ironclad", "NetSuite", "Coupa", "Adaptive Planning",
+})
+
+# One bit per sensitive tool; counting a workflow's PII or compliance tools
+# is then an AND plus a popcount instead of a set intersection
+_TOOL_BIT: dict[str, int] = {
+    tool: 1 << i for i, tool in enumerate(sorted(_PII_TOOLS | _COMPLIANCE_TOOLS))
 }
+_PII_MASK = sum(_TOOL_BIT[t] for t in _PII_TOOLS)
+_COMPLIANCE_MASK = sum(_TOOL_BIT[t] for t in _COMPLIANCE_TOOLS)
+_LINKEDIN_BIT = _TOOL_BIT["LinkedIn Sales Navigator"]
 
 # High-regulation departments
-_HIGH_REG_DEPTS = {"legal", "finance", "people_hr"}
+_HIGH_REG_DEPTS = frozenset({"legal", "finance", "people_hr"})
+
+
+def _tool_mask(wf: dict) -> int:
+    """Bitmask of the workflow's sensitive tools (duplicates collapse into one bit)."""
+    mask = 0
+    for tool in wf.get("current_tools", ()):
+        mask |= _TOOL_BIT.get(tool, 0)
+    return mask
 
 
 # ---- Dimension scorers -----------------------------------------------------
@@ -70,12 +88,12 @@ def score_stakeholder(wf: dict) -> float:
 
 def score_ethical(wf: dict) -> float:
     """Ethical Risk based on data sensitivity of current tools."""
-    tools = set(wf.get("current_tools", []))
-    pii_count = len(tools & _PII_TOOLS)
+    mask = _tool_mask(wf)
+    pii_count = (mask & _PII_MASK).bit_count()
     base = 1.0
     base += pii_count * 3.0
     # LinkedIn / personal data tools add extra
-    if "LinkedIn Sales Navigator" in tools:
+    if mask & _LINKEDIN_BIT:
         base += 1.5
     return round(min(base, 10.0), 2)
 
@@ -84,12 +102,12 @@ def score_legal(wf: dict) -> float:
     """Legal/Regulatory Risk based on department and compliance tools."""
     dept = wf["department"]
     base = 7.0 if dept in _HIGH_REG_DEPTS else 1.5
-    tools = set(wf.get("current_tools", []))
-    compliance_count = len(tools & _COMPLIANCE_TOOLS)
+    mask = _tool_mask(wf)
+    compliance_count = (mask & _COMPLIANCE_MASK).bit_count()
     base += compliance_count * 2.0
     # PII tools in regulated departments amplify legal risk
     if dept in _HIGH_REG_DEPTS:
-        pii_count = len(tools & _PII_TOOLS)
+        pii_count = (mask & _PII_MASK).bit_count()
         base += pii_count * 1.0
     return round(min(base, 10.0), 2)
 
@@ -118,6 +136,29 @@ _WEIGHTS = {
 
 def compute_risk(wf: dict) -> dict:
     """Return all four dimension scores, composite risk, risk level, and controls."""
+    hit = _precomputed_risks().get(wf.get("id"))
+    if hit is not None and hit[0] is wf:
+        risk = hit[1]
+        return {**risk, "controls": list(risk["controls"])}
+    return _compute_risk(wf)
+
+
+@functools.cache
+def _precomputed_risks() -> dict[str, tuple[dict, dict]]:
+    """Risk of every POC 2 workflow, scored in one batch on first use, keyed by id.
+
+    Each entry keeps the workflow dict it was scored from; any other dict
+    under the same id (an edited copy, say) is scored afresh.
+    """
+    workflows = get_workflows()
+    scores = compute_risk_batch(workflows)
+    return {
+        wf["id"]: (wf, _risk_entry(*row, level))
+        for wf, row, level in zip(workflows, scores.tolist(), risk_levels(scores[:, 4]))
+    }
+
+
+def _compute_risk(wf: dict) -> dict:
     s = score_stakeholder(wf)
     e = score_ethical(wf)
     l = score_legal(wf)
@@ -140,6 +181,10 @@ def compute_risk(wf: dict) -> dict:
     else:
         level = "critical"
 
+    return _risk_entry(s, e, l, o, composite, level)
+
+
+def _risk_entry(s: float, e: float, l: float, o: float, composite: float, level: str) -> dict:
     # Low-risk projects are still in triage — no controls assigned yet.
     # Medium-and-above have been through governance review.
     controls = [] if level == "low" else _assign_controls(s, e, l, o)
@@ -155,6 +200,55 @@ def compute_risk(wf: dict) -> dict:
     }
 
 
+# ---- Batch scoring ----------------------------------------------------------
+
+_RISK_LEVELS = ("low", "medium", "high", "critical")
+_RISK_LEVEL_BOUNDS = np.array([3.0, 5.0, 7.0])
+
+
+def compute_risk_batch(wfs: list[dict]) -> np.ndarray:
+    """(N, 5) stakeholder/ethical/legal/operational/composite scores, one row per workflow.
+
+    The scoring arithmetic runs as array ops; rounding the dimension and
+    composite columns to match compute_risk exactly is a per-element Python
+    pass (round2). risk_levels() maps the composite column to levels.
+    """
+    masks = [_tool_mask(wf) for wf in wfs]
+    stake_base = np.array([_STAKEHOLDER_BASE.get(wf["department"], 4.0) for wf in wfs])
+    occ = np.array([wf.get("occurrences_per_month", 1) for wf in wfs], dtype=float)
+    high_reg = np.array([wf["department"] in _HIGH_REG_DEPTS for wf in wfs], dtype=bool)
+    pii = np.array([(m & _PII_MASK).bit_count() for m in masks], dtype=float)
+    compliance = np.array([(m & _COMPLIANCE_MASK).bit_count() for m in masks], dtype=float)
+    linkedin = np.array([bool(m & _LINKEDIN_BIT) for m in masks], dtype=bool)
+    hours = np.array([wf.get("estimated_build_hours", 60) for wf in wfs], dtype=float)
+    num_tools = np.array([len(wf.get("current_tools", [])) for wf in wfs], dtype=float)
+
+    freq_add = np.minimum(np.log2(np.maximum(occ, 1)) / math.log2(300) * 4.0, 4.0)
+    hours_score = np.clip(1.0 + ((hours - 20) / (120 - 20)) * 8.0, 1.0, 9.0)
+    dims = round2(np.column_stack([
+        np.minimum(stake_base + freq_add, 10.0),
+        np.minimum(1.0 + pii * 3.0 + np.where(linkedin, 1.5, 0.0), 10.0),
+        np.minimum(np.where(high_reg, 7.0, 1.5) + compliance * 2.0 + np.where(high_reg, pii, 0.0), 10.0),
+        np.minimum(hours_score + np.minimum(num_tools * 0.4, 2.0), 10.0),
+    ]))
+    stakeholder, ethical, legal, operational = dims.T
+
+    # Weighted sum term by term in compute_risk's order rather than a matmul,
+    # so the rounded composite matches it exactly
+    composite = round2(
+        _WEIGHTS["stakeholder"] * stakeholder
+        + _WEIGHTS["ethical"] * ethical
+        + _WEIGHTS["legal"] * legal
+        + _WEIGHTS["operational"] * operational
+    )
+    return np.column_stack([dims, composite])
+
+
+def risk_levels(composite: np.ndarray) -> list[str]:
+    """Risk level per composite score, using compute_risk's 3/5/7 cut-offs."""
+    return [_RISK_LEVELS[i] for i in np.digitize(composite, _RISK_LEVEL_BOUNDS).tolist()]
+
+
 def _assign_controls(stakeholder: float, ethical: float, legal: float, operational: float) -> list[str]:
     """Auto-assign 3-6 ISO 42001 controls based on risk profile."""
     controls_data = _load_controls()
@@ -192,14 +286,7 @@ def _assign_controls(stakeholder: float, ethical: float, legal: float, operation
         assigned.extend(["A.10.4", "A.10.5", "A.10.6"])
 
     # Deduplicate while preserving order
-    seen: set[str] = set()
-    unique: list[str] = []
-    for cid in assigned:
-        if cid not in seen:
-            seen.add(cid)
-            unique.append(cid)
-
-    return unique
+    return list(dict.fromkeys(assigned))
 
 
 # ---- Benefit score from POC 2 -----------------------------------------------
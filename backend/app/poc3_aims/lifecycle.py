@@ -32,24 +32,21 @@ _ACTIVE_STATUSES = {
 
 _ALL_STATUSES = _ACTIVE_STATUSES | {"on_hold", "retired"}
 
-
-def is_valid_transition(from_status: str, to_status: str) -> bool:
-    """Check if a status transition is allowed."""
-    if to_status not in _ALL_STATUSES:
-        return False
-
+# Every allowed (from, to) pair
+_VALID_TRANSITIONS: frozenset[tuple[str, str]] = frozenset(
     # Any active status can go to on_hold or retired
-    if to_status == "on_hold" and from_status in _ACTIVE_STATUSES:
-        return True
-    if to_status == "retired" and from_status in _ACTIVE_STATUSES:
-        return True
-
+    [(a, "on_hold") for a in _ACTIVE_STATUSES]
+    + [(a, "retired") for a in _ACTIVE_STATUSES]
     # on_hold can go back to any active status
-    if from_status == "on_hold" and to_status in _ACTIVE_STATUSES:
-        return True
+    + [("on_hold", a) for a in _ACTIVE_STATUSES]
+    # Normal forward transitions
+    + list(_FORWARD.items())
+)
+
 
-    # Normal forward transition
-    return _FORWARD.get(from_status) == to_status
+def is_valid_transition(from_status: str, to_status: str) -> bool:
+    """Check if a status transition is allowed."""
+    return (from_status, to_status) in _VALID_TRANSITIONS
 
 
 def transition(
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import bisect
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
-from sqlalchemy import select, func, desc
+from pydantic import BaseModel, field_serializer, field_validator
+from sqlalchemy import select, func, desc, case, literal, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_db
@@ -17,6 +19,16 @@ from .impact_assessment import _load_controls
 router = APIRouter()
 
 
+# ---------------------------------------------------------------------------
+# Helper to serialize datetimes
+# ---------------------------------------------------------------------------
+
+def _dt(val) -> Optional[str]:
+    if val is None:
+        return None
+    return val.isoformat()
+
+
 # ---------------------------------------------------------------------------
 # Response schemas
 # ---------------------------------------------------------------------------
@@ -32,16 +44,25 @@ class ProjectSummary(BaseModel):
     benefit_score: float
     owner: str
     controls: list[str]
-    review_due: Optional[str] = None
+    review_due: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+    @field_validator("controls", mode="before")
+    @classmethod
+    def _null_as_empty(cls, v):
+        return v or []
+
+    @field_serializer("review_due")
+    def _iso(self, v: Optional[datetime]) -> Optional[str]:
+        return _dt(v)
+
 
 class EventOut(BaseModel):
     id: int
     project_id: int
-    timestamp: str
+    timestamp: datetime
     event_type: str
     from_status: Optional[str] = None
     to_status: Optional[str] = None
@@ -51,6 +72,10 @@ class EventOut(BaseModel):
     class Config:
         from_attributes = True
 
+    @field_serializer("timestamp")
+    def _iso(self, v: datetime) -> str:
+        return v.isoformat()
+
 
 class ProjectDetail(BaseModel):
     id: int
@@ -66,19 +91,29 @@ class ProjectDetail(BaseModel):
     risk_score: float
     benefit_score: float
     approved_by: list[str]
-    approval_date: Optional[str] = None
+    approval_date: Optional[datetime] = None
     owner: str
-    review_due: Optional[str] = None
-    last_reviewed: Optional[str] = None
+    review_due: Optional[datetime] = None
+    last_reviewed: Optional[datetime] = None
     controls: list[str]
     notes: Optional[str] = None
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
+    # Not a column: filled in from the event query after validation
     events: list[EventOut] = []
 
     class Config:
         from_attributes = True
 
+    @field_validator("approved_by", "controls", mode="before")
+    @classmethod
+    def _null_as_empty(cls, v):
+        return v or []
+
+    @field_serializer("approval_date", "review_due", "last_reviewed", "created_at", "updated_at")
+    def _iso(self, v: Optional[datetime]) -> Optional[str]:
+        return _dt(v)
+
 
 class DashboardResponse(BaseModel):
     total_projects: int
@@ -99,6 +134,9 @@ class RiskMatrixItem(BaseModel):
     benefit_score: float
     risk_level: str
 
+    class Config:
+        from_attributes = True
+
 
 class ControlOut(BaseModel):
     id: str
@@ -125,14 +163,10 @@ class TransitionRequest(BaseModel):
     actor: str
 
 
-# ---------------------------------------------------------------------------
-# Helper to serialize datetimes
-# ---------------------------------------------------------------------------
-
-def _dt(val) -> Optional[str]:
-    if val is None:
-        return None
-    return val.isoformat()
+def _project_detail(p: AIProject, events) -> ProjectDetail:
+    detail = ProjectDetail.model_validate(p)
+    detail.events = [EventOut.model_validate(e) for e in events]
+    return detail
 
 
 # ---------------------------------------------------------------------------
@@ -142,37 +176,44 @@ def _dt(val) -> Optional[str]:
 @router.get("/dashboard", response_model=DashboardResponse)
 async def dashboard(db: AsyncSession = Depends(get_db)):
     """Summary stats for the AIMS dashboard."""
-    result = await db.execute(select(AIProject))
-    projects = result.scalars().all()
-
-    by_status: dict[str, int] = {}
-    by_risk: dict[str, int] = {}
-    by_dept: dict[str, int] = {}
-    overdue = 0
-    total_risk = 0.0
-    total_benefit = 0.0
-
-    from datetime import datetime
     now = datetime.utcnow()
 
-    for p in projects:
-        by_status[p.status] = by_status.get(p.status, 0) + 1
-        by_risk[p.risk_level] = by_risk.get(p.risk_level, 0) + 1
-        by_dept[p.department] = by_dept.get(p.department, 0) + 1
-        total_risk += p.risk_score
-        total_benefit += p.benefit_score
-        if p.review_due and p.review_due < now:
-            overdue += 1
-
-    n = len(projects) or 1
+    # All three breakdowns in one round-trip, each bucket ordered by the
+    # lowest project id in it (the order buckets first appear in by id)
+    breakdowns = union_all(*(
+        select(
+            literal(kind).label("kind"),
+            column.label("key"),
+            func.count().label("n"),
+            func.min(AIProject.id).label("first_id"),
+        ).group_by(column)
+        for kind, column in (
+            ("status", AIProject.status),
+            ("risk_level", AIProject.risk_level),
+            ("department", AIProject.department),
+        )
+    )).order_by("first_id")
+    counts: dict[str, dict[str, int]] = {"status": {}, "risk_level": {}, "department": {}}
+    for r in (await db.execute(breakdowns)).all():
+        counts[r.kind][r.key] = r.n
+
+    totals = (await db.execute(
+        select(
+            func.count(AIProject.id).label("total"),
+            func.avg(AIProject.risk_score).label("avg_risk"),
+            func.avg(AIProject.benefit_score).label("avg_benefit"),
+            func.sum(case((AIProject.review_due < now, 1), else_=0)).label("overdue"),
+        )
+    )).one()
+
     return DashboardResponse(
-        total_projects=len(projects),
-        by_status=by_status,
-        by_risk_level=by_risk,
-        by_department=by_dept,
-        overdue_reviews=overdue,
-        avg_risk_score=round(total_risk / n, 2),
-        avg_benefit_score=round(total_benefit / n, 2),
+        total_projects=totals.total,
+        by_status=counts["status"],
+        by_risk_level=counts["risk_level"],
+        by_department=counts["department"],
+        overdue_reviews=totals.overdue or 0,
+        avg_risk_score=round(totals.avg_risk or 0.0, 2),
+        avg_benefit_score=round(totals.avg_benefit or 0.0, 2),
     )
 
 
@@ -181,9 +222,11 @@ async def list_projects(
     status: Optional[str] = Query(None),
     risk_level: Optional[str] = Query(None),
     department: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all 40 projects with optional filters."""
+    """List projects (all 40 fit the default page) with optional filters."""
     query = select(AIProject)
     if status:
         query = query.where(AIProject.status == status)
@@ -191,27 +234,12 @@ async def list_projects(
         query = query.where(AIProject.risk_level == risk_level)
     if department:
         query = query.where(AIProject.department == department)
-    query = query.order_by(AIProject.id)
-
-    result = await db.execute(query)
-    projects = result.scalars().all()
+    query = query.order_by(AIProject.id).limit(limit).offset(offset)
 
-    return [
-        ProjectSummary(
-            id=p.id,
-            workflow_id=p.workflow_id,
-            name=p.name,
-            department=p.department,
-            status=p.status,
-            risk_level=p.risk_level,
-            risk_score=p.risk_score,
-            benefit_score=p.benefit_score,
-            owner=p.owner,
-            controls=p.controls or [],
-            review_due=_dt(p.review_due),
-        )
-        for p in projects
-    ]
+    # Stream the page in batches and validate rows as they arrive, rather
+    # than materializing the whole result first
+    result = await db.stream_scalars(query.execution_options(yield_per=100))
+    return [ProjectSummary.model_validate(p) async for p in result]
 
 
 @router.get("/projects/{project_id}", response_model=ProjectDetail)
@@ -231,42 +259,7 @@ async def get_project(project_id: int, db: AsyncSession = Depends(get_db)):
     )
     events = events_result.scalars().all()
 
-    return ProjectDetail(
-        id=p.id,
-        workflow_id=p.workflow_id,
-        name=p.name,
-        department=p.department,
-        status=p.status,
-        risk_level=p.risk_level,
-        impact_stakeholder=p.impact_stakeholder,
-        impact_ethical=p.impact_ethical,
-        impact_legal=p.impact_legal,
-        impact_operational=p.impact_operational,
-        risk_score=p.risk_score,
-        benefit_score=p.benefit_score,
-        approved_by=p.approved_by or [],
-        approval_date=_dt(p.approval_date),
-        owner=p.owner,
-        review_due=_dt(p.review_due),
-        last_reviewed=_dt(p.last_reviewed),
-        controls=p.controls or [],
-        notes=p.notes,
-        created_at=_dt(p.created_at),
-        updated_at=_dt(p.updated_at),
-        events=[
-            EventOut(
-                id=e.id,
-                project_id=e.project_id,
-                timestamp=_dt(e.timestamp),
-                event_type=e.event_type,
-                from_status=e.from_status,
-                to_status=e.to_status,
-                actor=e.actor,
-                detail=e.detail,
-            )
-            for e in events
-        ],
-    )
+    return _project_detail(p, events)
 
 
 @router.get("/risk-matrix", response_model=list[RiskMatrixItem])
@@ -274,18 +267,7 @@ async def risk_matrix(db: AsyncSession = Depends(get_db)):
     """Risk vs Benefit scatter data for all projects."""
     result = await db.execute(select(AIProject).order_by(AIProject.id))
     projects = result.scalars().all()
-    return [
-        RiskMatrixItem(
-            id=p.id,
-            name=p.name,
-            department=p.department,
-            status=p.status,
-            risk_score=p.risk_score,
-            benefit_score=p.benefit_score,
-            risk_level=p.risk_level,
-        )
-        for p in projects
-    ]
+    return [RiskMatrixItem.model_validate(p) for p in projects]
 
 
 @router.get("/controls", response_model=list[ControlOut])
@@ -320,27 +302,18 @@ async def timeline(
     db: AsyncSession = Depends(get_db),
 ):
     """Recent events across all projects."""
-    # Get events with project names via a join-like approach
-    events_result = await db.execute(
-        select(AIMSEvent).order_by(desc(AIMSEvent.timestamp)).limit(limit)
+    result = await db.execute(
+        select(AIMSEvent, func.coalesce(AIProject.name, "Unknown").label("project_name"))
+        .outerjoin(AIProject, AIProject.id == AIMSEvent.project_id)
+        .order_by(desc(AIMSEvent.timestamp))
+        .limit(limit)
     )
-    events = events_result.scalars().all()
-
-    # Fetch project names for these events
-    project_ids = list({e.project_id for e in events})
-    if project_ids:
-        projects_result = await db.execute(
-            select(AIProject).where(AIProject.id.in_(project_ids))
-        )
-        proj_map = {p.id: p.name for p in projects_result.scalars().all()}
-    else:
-        proj_map = {}
 
     return [
         TimelineEvent(
             id=e.id,
             project_id=e.project_id,
-            project_name=proj_map.get(e.project_id, "Unknown"),
+            project_name=project_name,
             timestamp=_dt(e.timestamp),
             event_type=e.event_type,
             from_status=e.from_status,
@@ -348,7 +321,7 @@ async def timeline(
             actor=e.actor,
             detail=e.detail,
         )
-        for e in events
+        for e, project_name in result.all()
     ]
 
 
@@ -371,18 +344,30 @@ async def transition_project(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    # Event history for the response: read it once now, and merge the new
+    # event in below rather than re-querying after the commit
+    events_result = await db.execute(
+        select(AIMSEvent)
+        .where(AIMSEvent.project_id == project_id)
+        .order_by(AIMSEvent.timestamp)
+    )
+    events = list(events_result.scalars().all())
+
     # Apply project updates
     for key, val in t["project_updates"].items():
         setattr(p, key, val)
 
-    # Create event
+    # Create event, stamped with the transition time rather than DB server time
     event = AIMSEvent(
         project_id=project_id,
         **t["event"],
     )
     db.add(event)
+    # Sessions don't expire on commit and updated_at is set explicitly, so p
+    # and event are current without a refresh
     await db.commit()
-    await db.refresh(p)
+    # Seeded histories can hold future-dated events, so keep timestamp order
+    bisect.insort(events, event, key=lambda e: e.timestamp)
 
     # Incremental graph sync (non-fatal)
     try:
@@ -391,47 +376,4 @@ async def transition_project(
     except Exception:
         pass
 
-    # Re-fetch events for response
-    events_result = await db.execute(
-        select(AIMSEvent)
-        .where(AIMSEvent.project_id == project_id)
-        .order_by(AIMSEvent.timestamp)
-    )
-    events = events_result.scalars().all()
-
-    return ProjectDetail(
-        id=p.id,
-        workflow_id=p.workflow_id,
-        name=p.name,
-        department=p.department,
-        status=p.status,
-        risk_level=p.risk_level,
-        impact_stakeholder=p.impact_stakeholder,
-        impact_ethical=p.impact_ethical,
-        impact_legal=p.impact_legal,
-        impact_operational=p.impact_operational,
-        risk_score=p.risk_score,
-        benefit_score=p.benefit_score,
-        approved_by=p.approved_by or [],
-        approval_date=_dt(p.approval_date),
-        owner=p.owner,
-        review_due=_dt(p.review_due),
-        last_reviewed=_dt(p.last_reviewed),
-        controls=p.controls or [],
-        notes=p.notes,
-        created_at=_dt(p.created_at),
-        updated_at=_dt(p.updated_at),
-        events=[
-            EventOut(
-                id=e.id,
-                project_id=e.project_id,
-                timestamp=_dt(e.timestamp),
-                event_type=e.event_type,
-                from_status=e.from_status,
-                to_status=e.to_status,
-                actor=e.actor,
-                detail=e.detail,
-            )
-            for e in events
-        ],
-    )
+    return _project_detail(p, events)